@@ -437,8 +437,7 @@ class EncryptionManager:
 
     def encrypt_json(self, data_dict: dict, filepath: str):
         payload = json.dumps(data_dict).encode("utf-8")
-        with open(filepath, "wb") as f:
-            f.write(self.fernet.encrypt(payload))
+        self.encrypt_bytes(payload, filepath)
 
     def decrypt_json(self, filepath: str):
         if not os.path.exists(filepath):
@@ -450,6 +449,24 @@ class EncryptionManager:
             print(f"[CRYPTO] decrypt_json failed for '{filepath}': {e}")
             return None
 
+    def encrypt_bytes(self, payload: bytes, filepath: str):
+        """Encrypt an already-serialized payload and write it to `filepath`."""
+        # Write beside the target and swap in: a crash mid-write can't
+        # leave a truncated (= "tampered") records vault behind
+        tmp = filepath + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.fernet.encrypt(payload))
+        os.replace(tmp, filepath)
+
+    def decrypt_bytes(self, filepath: str):
+        """Return the decrypted payload bytes, or None if missing/tampered."""
+        try:
+            data = open(filepath, "rb").read()
+            return self.fernet.decrypt(data)
+        except Exception as e:
+            print(f"[CRYPTO] decrypt_bytes failed for '{filepath}': {e}")
+            return None
+
     def encrypt_string(self, text: str) -> str:
         return self.fernet.encrypt(text.encode("utf-8")).decode("utf-8")
 
@@ -41,7 +41,9 @@ import os
 import json
 import socket
 import platform
+import atexit
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
@@ -417,7 +419,53 @@ def build_ecs_event(
 # ── Telemetry log writer ───────────────────────────────────────────────────────
 
 # Thread lock so concurrent log writes don't interleave partial JSON lines
-_TELEMETRY_LOCK = threading.Lock()
+_TELEMETRY_LOCK = threading.RLock()
+_TELEMETRY_FH   = None   # long-lived, line-buffered append handle
+_TELEMETRY_PATH = None   # resolved once on first event
+
+
+def _telemetry_path() -> str:
+    """logs/telemetry.jsonl under the same data root as integrity_log.dat."""
+    global _TELEMETRY_PATH
+    if _TELEMETRY_PATH is None:
+        try:
+            from core.utils import get_app_data_dir
+            _log_dir = os.path.join(get_app_data_dir(), "logs")
+        except Exception:
+            _log_dir = os.path.join(
+                os.getenv("APPDATA", os.path.expanduser("~")),
+                "FMSecure", "logs"
+            )
+        os.makedirs(_log_dir, exist_ok=True)
+        _TELEMETRY_PATH = os.path.join(_log_dir, "telemetry.jsonl")
+    return _TELEMETRY_PATH
+
+
+def close_telemetry_handle() -> None:
+    """Flush + close the append handle (reopened lazily on the next event)."""
+    global _TELEMETRY_FH
+    with _TELEMETRY_LOCK:
+        if _TELEMETRY_FH is not None:
+            try:
+                _TELEMETRY_FH.close()
+            except Exception:
+                pass
+            _TELEMETRY_FH = None
+
+
+@contextmanager
+def telemetry_detached():
+    """
+    Pause telemetry writes and release the file while it is rotated or
+    rewritten (Windows can't replace a file we hold open, and on POSIX the
+    handle would keep appending to the old inode).
+    """
+    with _TELEMETRY_LOCK:
+        close_telemetry_handle()
+        yield
+
+
+atexit.register(close_telemetry_handle)
 
 
 def emit_telemetry_event(
@@ -457,22 +505,13 @@ def emit_telemetry_event(
         )
         line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
 
-        # Resolve telemetry log path from the same data root as integrity_log.dat
-        try:
-            from core.utils import get_app_data_dir
-            _log_dir = os.path.join(get_app_data_dir(), "logs")
-        except Exception:
-            _log_dir = os.path.join(
-                os.getenv("APPDATA", os.path.expanduser("~")),
-                "FMSecure", "logs"
-            )
-
-        telemetry_path = os.path.join(_log_dir, "telemetry.jsonl")
-        os.makedirs(_log_dir, exist_ok=True)
-
+        global _TELEMETRY_FH
         with _TELEMETRY_LOCK:
-            with open(telemetry_path, "a", encoding="utf-8") as fh:
-                fh.write(line + "\n")
+            # One handle for the process lifetime: an event costs one write()
+            # instead of open + write + close
+            if _TELEMETRY_FH is None or _TELEMETRY_FH.closed:
+                _TELEMETRY_FH = open(_telemetry_path(), "a", encoding="utf-8", buffering=1)
+            _TELEMETRY_FH.write(line + "\n")
 
     except Exception:
         pass   # Never block the calling thread — telemetry is best-effort
@@ -581,7 +620,8 @@ def rotate_telemetry_if_needed(max_mb: float = 50.0) -> None:
             return
         ts   = datetime.now().strftime("%Y%m%d%H%M%S")
         dest = os.path.join(_log_dir, f"telemetry_{ts}.jsonl")
-        os.replace(path, dest)
+        with telemetry_detached():
+            os.replace(path, dest)
         # Keep only last 3 rotated files
         archives = sorted([
             f for f in os.listdir(_log_dir)
@@ -19,7 +19,7 @@ import hashlib
 import traceback
 from datetime import datetime
 
-from core.utils import get_app_data_dir
+from core.utils import get_app_data_dir, tail_file
 from core.encryption_manager import crypto_manager
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
@@ -47,24 +47,37 @@ def _hide_dir_windows(path):
 
 # ── Index management ──────────────────────────────────────────────────────────
 
+_INDEX_CACHE = (None, [])   # ((mtime_ns, size), parsed entries)
+
+
 def _load_index():
     """Load the plaintext index of all snapshots."""
-    if not os.path.exists(INDEX_FILE):
-        return []
+    global _INDEX_CACHE
     try:
-        with open(INDEX_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        st = os.stat(INDEX_FILE)
+    except OSError:
         return []
+    # Re-parse only when the index file actually changed
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _INDEX_CACHE[0] != stamp:
+        try:
+            with open(INDEX_FILE, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except Exception:
+            return []
+        _INDEX_CACHE = (stamp, entries)
+    return list(_INDEX_CACHE[1])
 
 
 def _save_index(entries):
     """Persist the index. Kept as plaintext JSON — it only contains metadata, not evidence."""
+    global _INDEX_CACHE
     try:
         with open(INDEX_FILE, "w", encoding="utf-8") as f:
             json.dump(entries, f, indent=2)
     except Exception as e:
         print(f"[FORENSICS] Could not update index: {e}")
+    _INDEX_CACHE = (None, [])
 
 
 def _register_snapshot(snapshot_id, filename, event_type, severity, affected_count):
@@ -148,11 +161,19 @@ def _collect_critical_hashes():
         "severity_counters":os.path.join(LOG_DIR, "severity_counters.json"),
     }
     result = {}
+    buf = bytearray(1024 * 1024)   # stream in 1 MiB chunks – the log can be large
+    view = memoryview(buf)
     for label, path in targets.items():
         if os.path.exists(path):
             try:
-                with open(path, "rb") as f:
-                    result[label] = hashlib.sha256(f.read()).hexdigest()[:16]
+                h = hashlib.sha256()
+                with open(path, "rb", buffering=0) as f:
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        h.update(view[:n])
+                result[label] = h.hexdigest()[:16]
             except Exception as e:
                 result[label] = f"error: {e}"
         else:
@@ -170,10 +191,8 @@ def _collect_recent_log_lines(count=15):
     if not os.path.exists(LOG_FILE):
         return ["Log file not found."]
     try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            raw_lines = f.readlines()
-        recent = raw_lines[-count:] if len(raw_lines) > count else raw_lines
-        for raw in recent:
+        # Seek from the end – only the last `count` lines are read
+        for raw in tail_file(LOG_FILE, count):
             raw = raw.strip()
             if not raw:
                 continue
@@ -6,6 +6,7 @@ Core backend logic for Secure File Integrity Monitor
 - No CLI-specific code
 """
 
+import atexit
 import os
 import json
 import time
@@ -14,6 +15,11 @@ import hmac
 import threading
 import traceback
 import shutil
+import itertools
+import mmap
+import queue
+import re
+import fnmatch
 from datetime import datetime
 import concurrent.futures
 from core.encryption_manager import crypto_manager
@@ -135,6 +141,18 @@ try:
 except Exception:
     requests = None  # webhook optional; code will continue without requests
 
+try:
+    import msgpack
+except Exception:
+    msgpack = None  # records fall back to compact JSON
+
+try:
+    import orjson
+    _json_loads = orjson.loads      # accepts bytes directly, several x faster
+except Exception:
+    orjson = None
+    _json_loads = json.loads
+
 
 # --- GLOBAL MEMORY COUNTERS (Prevents Race Conditions) ---
 _COUNTER_LOCK = threading.Lock()
@@ -244,12 +262,12 @@ EVENT_SEVERITY = {
 
 # --- IMPORT THE UTILITY ---
 try:
-    from core.utils import get_app_data_dir, get_base_path
+    from core.utils import get_app_data_dir, get_base_path, tail_start_offset
 except ImportError:
     # Fallback if running directly
     import sys
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from core.utils import get_app_data_dir, get_base_path
+    from core.utils import get_app_data_dir, get_base_path, tail_start_offset
 
 # --- SETUP PATHS CORRECTLY ---
 DATA_ROOT = get_app_data_dir()
@@ -272,6 +290,7 @@ HASH_RECORD_FILE = os.path.join(log_dir, "hash_records.dat")
 HASH_SIGNATURE_FILE = os.path.join(log_dir, "hash_records.sig")
 LOG_FILE = os.path.join(log_dir, "integrity_log.dat")
 LOG_SIG_FILE = os.path.join(log_dir, "integrity_log.sig")
+LOG_STATE_FILE = os.path.join(log_dir, "integrity_log.state")
 REPORT_SUMMARY_FILE = os.path.join(log_dir, "report_summary.txt")
 SEVERITY_COUNTER_FILE = os.path.join(log_dir, "severity_counters.json")
 
@@ -318,11 +337,25 @@ def get_severity(event_type):
 
 
 # ------------------ Utilities ------------------
+# Both timestamp formats only have 1-second resolution, so format once per
+# wall-clock second (tuple swap is atomic -> safe from watchdog threads).
+_NOW_CACHE = (None, "", "")   # (epoch second, pretty, iso)
+
+def _now_strings():
+    global _NOW_CACHE
+    t = int(time.time())
+    cached = _NOW_CACHE
+    if cached[0] != t:
+        lt = time.localtime(t)
+        cached = _NOW_CACHE = (t, time.strftime("%Y-%m-%d %H:%M:%S", lt),
+                               time.strftime("%Y-%m-%dT%H:%M:%S", lt))
+    return cached
+
 def now_iso():
-    return datetime.now().isoformat(timespec='seconds')
+    return _now_strings()[2]
 
 def now_pretty():
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _now_strings()[1]
 
 def atomic_write_text(path, text):
     """Safely write text to a file"""
@@ -330,9 +363,7 @@ def atomic_write_text(path, text):
         tmp = path + ".tmp"
         with open(tmp, "w", encoding="utf-8") as f:
             f.write(text)
-        if os.path.exists(path):
-            os.remove(path)
-        os.rename(tmp, path)
+        os.replace(tmp, path)   # atomic on POSIX and Windows
     except Exception as e:
         print(f"Error in atomic_write_text: {e}")
         # Fallback: direct write
@@ -342,15 +373,23 @@ def atomic_write_text(path, text):
         except Exception as e2:
             print(f"Fallback write also failed: {e2}")
 
+def atomic_write_bytes(path, data):
+    """Safely write raw bytes to a file"""
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"Error in atomic_write_bytes: {e}")
+
 def atomic_write_json(path, obj):
     """Safely write JSON to a file"""
     try:
         tmp = path + ".tmp"
         with open(tmp, "w", encoding="utf-8") as f:
             json.dump(obj, f, indent=4, sort_keys=True)
-        if os.path.exists(path):
-            os.remove(path)
-        os.rename(tmp, path)
+        os.replace(tmp, path)
     except Exception as e:
         print(f"Error in atomic_write_json: {e}")
 
@@ -366,10 +405,22 @@ def load_config(path=None):
         "max_log_size_mb": 10,
         "max_log_backups": 5,
         "hash_algo": "sha256",
-        "hash_chunk_size": 65536,
+        "hash_chunk_size": 1024 * 1024,    # read size for the chunked (non-mmap) path
+        "mmap_threshold": 4 * 1024 * 1024, # files this big are hashed via mmap (0 = off)
         "hash_retries": 3,
         "hash_retry_delay": 0.5,
-        "ignore_filenames": ["hash_records.dat", "integrity_log.dat", "integrity_log.sig", "hash_records.sig", "report_summary.txt", "telemetry.jsonl"],
+        "modify_debounce_sec": 2.0,        # quiet period before a modified file is re-hashed
+        "create_settle_sec": 0.3,          # a new file must stop growing this long before its first hash (0 = immediate)
+        "scan_max_inflight": 64,           # max queued file reads during a full scan
+        "scan_io_depth": None,             # concurrent reads (hash threads); None = min(32, 4×CPUs)
+        # Full scan trusts an unchanged stat fingerprint. Off on Windows: there
+        # st_ctime is the creation time, so user code can forge every field.
+        "scan_skip_unchanged": os.name != "nt",
+        "records_save_delay": 0.1,         # coalesce record saves from event bursts (0 = immediate)
+        "records_save_duty": 0.2,          # max share of time spent re-encoding large record sets
+        "records_format": "msgpack",       # "msgpack" (if installed) or "json"
+        "ignore_filenames": ["hash_records.dat", "integrity_log.dat", "integrity_log.sig", "integrity_log.state", "hash_records.sig", "report_summary.txt", "telemetry.jsonl"],
+        "ignore_globs": [],                # whole-name wildcards, e.g. ["*.iso", "*.tmp.*"]
         "active_defense": False, 
         "vault_max_size_mb": 10,
         "vault_allowed_exts": [
@@ -416,10 +467,54 @@ def load_config(path=None):
     return True
 
 # ------------------ Logging & Log HMAC (per-line) ------------------
+# Persistent append handles for the log/sig pair. Opened lazily, kept open
+# across events, and closed before rotation/archive so the files can move.
+_LOG_IO_LOCK = threading.RLock()
+_LOG_FH = None
+_SIG_FH = None
+
+def _log_handles():
+    """Return (log_fh, sig_fh), opening them on first use. Caller holds _LOG_IO_LOCK."""
+    global _LOG_FH, _SIG_FH
+    if _LOG_FH is None or _LOG_FH.closed:
+        _LOG_FH = open(LOG_FILE, "a", encoding="utf-8")
+    if _SIG_FH is None or _SIG_FH.closed:
+        _SIG_FH = open(LOG_SIG_FILE, "a", encoding="utf-8")
+    return _LOG_FH, _SIG_FH
+
+def flush_logs(sync=True):
+    """Flush the open log/sig handles; fsync them too when `sync` is set."""
+    with _LOG_IO_LOCK:
+        for fh in (_LOG_FH, _SIG_FH):
+            if fh is None or fh.closed:
+                continue
+            try:
+                fh.flush()
+                if sync:
+                    os.fsync(fh.fileno())
+            except OSError as e:
+                print(f"Log flush error: {e}")
+
+def close_log_handles():
+    """Flush + close the persistent handles (needed before moving/truncating the files)."""
+    global _LOG_FH, _SIG_FH
+    with _LOG_IO_LOCK:
+        flush_logs()
+        for fh in (_LOG_FH, _SIG_FH):
+            if fh is not None:
+                try:
+                    fh.close()
+                except OSError:
+                    pass
+        _LOG_FH = _SIG_FH = None
+
+# Persist whatever the batched fsync hasn't covered yet on interpreter exit
+atexit.register(close_log_handles)
+
 def append_log_line(message, event_type="INFO", severity="INFO",
                     file_path=None, file_hash=None,
                     process_pid=None, process_name=None, process_parent=None):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = now_pretty()
     
     # --- 🚨 FIX 2: INJECT SEVERITY EMOJI SO GUI CAN FILTER IT ---
     color = SEVERITY_LEVELS.get(severity, {}).get("color", "")
@@ -433,11 +528,14 @@ def append_log_line(message, event_type="INFO", severity="INFO",
     
     # 3. Append the encrypted string to the file
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(encrypted_log + "\n")
-            
-        # 🚨 FIX 3: Write the HMAC signature immediately so the Auto-Healer doesn't have to!
-        append_log_signature(f"{encrypted_log}|UNKNOWN|{severity}")
+        # Line + signature under one lock so line N always pairs with sig N
+        with _LOG_IO_LOCK:
+            log_fh, _ = _log_handles()
+            log_fh.write(encrypted_log + "\n")
+            log_fh.flush()
+
+            # 🚨 FIX 3: Write the HMAC signature immediately so the Auto-Healer doesn't have to!
+            append_log_signature(f"{encrypted_log}|UNKNOWN|{severity}")
         
         # Update the math counters so the GUI dashboard refreshes
         update_severity_counter(severity)
@@ -513,8 +611,9 @@ def update_severity_counter(severity):
         counter_file = SEVERITY_COUNTER_FILE
         temp_file = counter_file + ".tmp"
         
+        # Written on every log line: compact C-encoder output, one write
         with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, indent=2)
+            f.write(json.dumps(data_to_save, separators=(",", ":")))
         
         if os.path.exists(counter_file):
             try:
@@ -537,16 +636,13 @@ def append_log_signature(line):
         # ENSURE CONFIG IS LOADED
         if "secret_key" not in CONFIG: load_config()
             
-        key = _get_hmac_key()
-        h = getattr(hashlib, CONFIG.get("hash_algo", "sha256"))
-        
         # Consistent UTF-8 encoding
-        sig = hmac.new(key, line.encode("utf-8"), h).hexdigest()
+        sig = _line_hmac(line.encode("utf-8")).hexdigest()
         
-        with open(LOG_SIG_FILE, "a", encoding="utf-8") as f:
-            f.write(sig + "\n")
-            f.flush()
-            os.fsync(f.fileno())
+        with _LOG_IO_LOCK:
+            _, sig_fh = _log_handles()
+            sig_fh.write(sig + "\n")
+            sig_fh.flush()   # fsync is batched via flush_logs()
     except Exception as e:
         print(f"Sig Write Error: {e}")
 
@@ -568,10 +664,12 @@ def rotate_logs_if_needed():
     ts = datetime.now().strftime("%Y%m%d%H%M%S")
     base = os.path.splitext(LOG_FILE)[0]
     new_log = f"{base}_{ts}.log"
-    os.replace(LOG_FILE, new_log)
-    if os.path.exists(LOG_SIG_FILE):
-        sig_new = f"{os.path.splitext(LOG_SIG_FILE)[0]}_{ts}.sig"
-        os.replace(LOG_SIG_FILE, sig_new)
+    with _LOG_IO_LOCK:
+        close_log_handles()
+        os.replace(LOG_FILE, new_log)
+        if os.path.exists(LOG_SIG_FILE):
+            sig_new = f"{os.path.splitext(LOG_SIG_FILE)[0]}_{ts}.sig"
+            os.replace(LOG_SIG_FILE, sig_new)
     # write rotation event
     append_log_line(f"LOG_ROTATED: {new_log}")
     cleanup_backups(base, CONFIG["max_log_backups"])
@@ -583,60 +681,186 @@ def rotate_logs_if_needed():
         pass
 
 def cleanup_backups(base, keep):
-    files = sorted([f for f in os.listdir(".") if f.startswith(base + "_")], reverse=True)
-    for old in files[keep:]:
-        try:
-            os.remove(old)
-        except Exception:
-            pass
+    """
+    Keep only the newest `keep` rotated copies of `base` (one set per extension,
+    so .log and .sig backups are pruned independently).
+    Scans the rotation directory itself, not the process CWD.
+    """
+    folder = os.path.dirname(base) or "."
+    prefix = os.path.basename(base) + "_"
+    by_ext = {}
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.is_file():
+                    by_ext.setdefault(os.path.splitext(entry.name)[1], []).append(entry)
+    except OSError:
+        return
+    for entries in by_ext.values():
+        # Names end in a %Y%m%d%H%M%S stamp, so name order == age order
+        entries.sort(key=lambda e: e.name, reverse=True)
+        for old in entries[keep:]:
+            try:
+                os.remove(old.path)
+            except OSError:
+                pass
 
 # ------------------ Hash records + HMAC ------------------
-def generate_records_hmac(records_dict):
-    raw = json.dumps(records_dict, sort_keys=True).encode("utf-8")
-    key = CONFIG["secret_key"].encode("utf-8")
-    h = getattr(hashlib, CONFIG["hash_algo"])
-    return hmac.new(key, raw, h).hexdigest()
+# Serializes the records file and its .sig so a reader never sees one without the other
+_RECORDS_IO_LOCK = threading.RLock()
+
+def canonical_records_bytes(records_dict):
+    """The one canonical serialization: encrypted on disk AND fed to the HMAC."""
+    if orjson is not None:
+        try:
+            # Same compact, key-sorted shape; the signature covers whatever
+            # bytes were written, so the UTF-8 (vs \u-escaped) output is fine.
+            return orjson.dumps(records_dict, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass   # e.g. surrogate-escaped (undecodable) POSIX filenames
+    return json.dumps(records_dict, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+# Digest fields stored as raw bytes in msgpack payloads (half the hex size);
+# in memory they stay hex, which is what logs, reports and the GUI consume.
+_RECORD_DIGEST_FIELDS = ("hash", "content")
+
+def _pack_record_digests(rec):
+    if not isinstance(rec, dict):
+        return rec
+    out = dict(rec)
+    for key in _RECORD_DIGEST_FIELDS:
+        value = out.get(key)
+        if isinstance(value, str):
+            try:
+                out[key] = bytes.fromhex(value)
+            except ValueError:
+                pass   # not a digest — keep the text as-is
+    return out
+
+def _unpack_record_digests(obj):
+    """msgpack object_hook: turn raw digest fields back into hex."""
+    for key in _RECORD_DIGEST_FIELDS:
+        value = obj.get(key)
+        if isinstance(value, bytes):
+            obj[key] = value.hex()
+    return obj
+
+def encode_records(records_dict):
+    """
+    Bytes that get encrypted to disk (and signed). msgpack when available —
+    roughly a third of the JSON size — otherwise canonical JSON.
+    """
+    if msgpack is not None and CONFIG.get("records_format", "msgpack") == "msgpack":
+        pack = _pack_record_digests
+        # surrogateescape: undecodable POSIX filenames round-trip as their raw bytes
+        return msgpack.packb({p: pack(r) for p, r in records_dict.items()},
+                             use_bin_type=True, unicode_errors="surrogateescape")
+    return canonical_records_bytes(records_dict)
+
+def decode_records(raw):
+    """Inverse of encode_records. JSON payloads always start with '{'."""
+    if raw[:1] == b"{":
+        try:
+            return _json_loads(raw)
+        except ValueError:
+            # canonical_records_bytes fell back to json.dumps for surrogate-escaped
+            # filenames; orjson rejects those lone \udcxx escapes, json does not
+            return json.loads(raw)
+    if msgpack is None:
+        raise ValueError("records are msgpack-encoded but msgpack is not installed")
+    # Older msgpack saves kept hex text; the hook only converts bytes values
+    return msgpack.unpackb(raw, raw=False, object_hook=_unpack_record_digests,
+                           unicode_errors="surrogateescape")
+
+_RECORDS_HMAC_BASE = (None, None)   # ((secret_key, hash_algo), keyed HMAC template)
+
+def _hmac_records_payload(raw):
+    global _RECORDS_HMAC_BASE
+    cache_key = (CONFIG.get("secret_key", ""), CONFIG.get("hash_algo", "sha256"))
+    if _RECORDS_HMAC_BASE[0] != cache_key:
+        # Rebuilt only when the secret or algorithm changes (config reload)
+        base = hmac.new(cache_key[0].encode("utf-8"), b"", _hash_ctor(cache_key[1]))
+        _RECORDS_HMAC_BASE = (cache_key, base)
+    h = _RECORDS_HMAC_BASE[1].copy()
+    h.update(raw)
+    return h.digest()
 
 def save_hash_records(records):
-    """Save the file baseline to the encrypted vault."""
+    """Save the file baseline to the encrypted vault and sign it."""
     try:
-        crypto_manager.encrypt_json(records, HASH_RECORD_FILE)
-        # Note: Fernet AES has built-in HMAC authentication. 
-        # You no longer technically need a separate .sig file for this database!
+        # Serialize once; the same bytes are encrypted and signed
+        raw = encode_records(records)
+        with _RECORDS_IO_LOCK:
+            crypto_manager.encrypt_bytes(raw, HASH_RECORD_FILE)
+            # Fernet already authenticates the ciphertext; the detached raw
+            # digest additionally pins the plaintext to our HMAC key.
+            atomic_write_bytes(HASH_SIGNATURE_FILE, _hmac_records_payload(raw))
     except Exception as e:
         print(f"Error saving encrypted hash records: {e}")
 
+def _load_records_payload():
+    """Decrypted records bytes; b"{}" if the file is absent, None if unreadable."""
+    if not os.path.exists(HASH_RECORD_FILE):
+        return b"{}"
+    return crypto_manager.decrypt_bytes(HASH_RECORD_FILE)
+
 def load_hash_records():
     """Load the file baseline from the encrypted vault."""
     if not os.path.exists(HASH_RECORD_FILE):
         return {}
         
-    data = crypto_manager.decrypt_json(HASH_RECORD_FILE)
-    if data is None:
+    raw = crypto_manager.decrypt_bytes(HASH_RECORD_FILE)
+    try:
+        data = decode_records(raw) if raw is not None else None
+    except Exception as e:
+        print(f"Error decoding hash records: {e}")
+        data = None
+    if not isinstance(data, dict):
         # Decryption failed! The file was tampered with.
         print("CRITICAL SECURITY ALERT: hash_records.dat corrupted or tampered with!")
         return {}
     return data
 
 def load_hash_signature():
-    if not os.path.exists(HASH_SIGNATURE_FILE):
-        return ""
+    """Return the stored records digest as raw bytes (b"" if missing)."""
     try:
-        with open(HASH_SIGNATURE_FILE, "r", encoding="utf-8") as f:
-            return f.read().strip()
-    except Exception:
-        return ""
+        with open(HASH_SIGNATURE_FILE, "rb") as f:
+            sig = f.read()
+    except OSError:
+        return b""
+    # Older installs stored the hex digest as text — twice the raw length
+    digest_size = hashlib.new(CONFIG.get("hash_algo", "sha256")).digest_size
+    text = sig.strip()
+    if len(text) == digest_size * 2:
+        try:
+            return bytes.fromhex(text.decode("ascii"))
+        except (UnicodeDecodeError, ValueError):
+            pass
+    return sig
 
 def verify_records_signature_on_disk():
-    records = load_hash_records()
-    sig = load_hash_signature()
-    if not sig:
-        save_hash_records(records)
-        append_log_line("INFO: No hash signature found; created new signature.", 
-                       event_type="SIGNATURE_CREATED", severity="INFO")
-        return True
-    expected = generate_records_hmac(records)
-    ok = hmac.compare_digest(expected, sig)
+    with _RECORDS_IO_LOCK:
+        raw = _load_records_payload()
+        sig = load_hash_signature()
+        if not sig:
+            save_hash_records(load_hash_records())
+            append_log_line("INFO: No hash signature found; created new signature.", 
+                           event_type="SIGNATURE_CREATED", severity="INFO")
+            return True
+        # HMAC the decrypted payload as-is — no parse + re-serialize round trip
+        ok = raw is not None and hmac.compare_digest(_hmac_records_payload(raw), sig)
+        if not ok and raw is not None:
+            # Records written before canonical saves (unsorted, spaced JSON):
+            # check the old signed form once and rewrite so the fast path
+            # applies next time.
+            try:
+                legacy = decode_records(raw)
+                legacy_raw = json.dumps(legacy, sort_keys=True).encode("utf-8")
+                ok = hmac.compare_digest(_hmac_records_payload(legacy_raw), sig)
+            except Exception:
+                ok = False
+            if ok:
+                save_hash_records(legacy)
     if not ok:
         append_log_line("ALERT: hash_records.json signature mismatch (possible tampering)", 
                        event_type="TAMPERED_RECORDS", severity="CRITICAL")
@@ -648,142 +872,477 @@ def verify_records_signature_on_disk():
 # ------------------ Log signature verification ------------------
 # [In integrity_core.py] Replace the verify_log_signatures function
 
+def _iter_log_lines(path, limit, start=0):
+    """
+    Stream (end_offset, line) for the non-blank lines between byte `start`
+    and `limit` of `path`. A line that crosses `limit` was still being
+    written, so it is left out.
+    """
+    if limit <= start:
+        return
+    consumed = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for raw in f:
+            consumed += len(raw)
+            if consumed > limit:
+                break
+            line = raw.decode("utf-8").rstrip("\r\n")
+            if line.strip():
+                yield consumed, line
+
+# Last verified prefix of the log/sig pair:
+#   {"log": bytes, "sig": bytes, "lines": n, "log_sha": hex, "sig_sha": hex}
+# Lines inside an unchanged prefix were already HMAC-checked, so the next run
+# only SHA-256s those bytes (C speed) and HMAC-verifies what was appended since.
+# Persisted to LOG_STATE_FILE (MAC'd with the log key) so a restart resumes too.
+_LOG_VERIFY_CHECKPOINT = None
+
+def _checkpoint_mac(cp):
+    body = json.dumps({k: cp[k] for k in ("log", "sig", "lines", "log_sha", "sig_sha")},
+                      sort_keys=True, separators=(",", ":"))
+    # "state|" prefix keeps this MAC distinct from any log-line signature
+    return _line_hmac(b"state|" + body.encode("utf-8")).hexdigest()
+
+def _load_log_checkpoint():
+    """Checkpoint from LOG_STATE_FILE, or None if missing / unreadable / forged."""
+    try:
+        with open(LOG_STATE_FILE, "r", encoding="utf-8") as f:
+            cp = json.load(f)
+        if hmac.compare_digest(str(cp.get("mac", "")), _checkpoint_mac(cp)):
+            return cp
+        print("[SECURITY] integrity_log.state MAC mismatch; doing a full log verification")
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_log_checkpoint(cp):
+    atomic_write_text(LOG_STATE_FILE, json.dumps(dict(cp, mac=_checkpoint_mac(cp))))
+
+def _hash_file_range(h, path, start, end):
+    """Feed bytes [start, end) of `path` into `h`; False if the file is shorter."""
+    remaining = end - start
+    if remaining <= 0:
+        return True
+    buf, view = _hash_read_buffer(CONFIG.get("hash_chunk_size", 1024 * 1024))
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            n = f.readinto(buf)
+            if not n:
+                return False
+            n = min(n, remaining)
+            h.update(view[:n])
+            remaining -= n
+    return True
+
+# Suffixes every line may be signed with, whatever its severity: INFO
+# (normal INFO lines and auto-healed ones) and the legacy "None".
+_LOG_SIG_SUFFIXES = (b"|UNKNOWN|INFO", b"|UNKNOWN|None")
+# Any other severity is only accepted if it matches the line's own badge
+_LOG_SEVERITY_BADGES = (("[🔴 CRITICAL]", "CRITICAL"), ("[🟠 HIGH]", "HIGH"),
+                        ("[🟡 MEDIUM]", "MEDIUM"))
+
+def _line_severity(line):
+    """Severity recorded in an (encrypted) log line's badge; INFO if none."""
+    try:
+        decrypted = crypto_manager.decrypt_string(line) or ""
+    except Exception:
+        return "INFO"
+    for badge, sev in _LOG_SEVERITY_BADGES:
+        if badge in decrypted:
+            return sev
+    return "INFO"
+
 def verify_log_signatures():
-    """Verify logs - Strict & Robust"""
+    """Verify logs - Strict & Robust (one streaming pass over log + sig)"""
     if not os.path.exists(LOG_FILE): return True, "No log file"
     
-    try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            log_lines = [l.rstrip("\n") for l in f.readlines() if l.strip()]
-    except: return False, "Read fail"
+    # Snapshot both sizes under the writer lock so we never see a line without its sig,
+    # then verify up to that point without blocking new log lines.
+    with _LOG_IO_LOCK:
+        flush_logs(sync=False)
+        try:
+            log_limit = os.path.getsize(LOG_FILE)
+        except OSError: return False, "Read fail"
+        try:
+            sig_limit = os.path.getsize(LOG_SIG_FILE) if os.path.exists(LOG_SIG_FILE) else 0
+        except OSError: return False, "Sig read fail"
 
-    if not log_lines: return True, "Empty"
+    if not log_limit: return True, "Empty"
 
-    sig_lines = []
-    if os.path.exists(LOG_SIG_FILE):
-        try:
-            with open(LOG_SIG_FILE, "r", encoding="utf-8") as f:
-                sig_lines = [s.rstrip("\n") for s in f.readlines() if s.strip()]
-        except: return False, "Sig read fail"
+    # Ensure config is loaded
+    if "secret_key" not in CONFIG: load_config()
 
-    # AUTO HEAL (Crash/Sync)
-    if len(log_lines) > len(sig_lines):
-        missing = len(log_lines) - len(sig_lines)
+    # Resume after the last verified prefix if it is still byte-for-byte intact
+    global _LOG_VERIFY_CHECKPOINT
+    if _LOG_VERIFY_CHECKPOINT is None:
+        _LOG_VERIFY_CHECKPOINT = _load_log_checkpoint() or {}
+    cp = _LOG_VERIFY_CHECKPOINT
+    log_start = sig_start = first_line = 0
+    log_sha, sig_sha = hashlib.sha256(), hashlib.sha256()
+    if cp and cp["log"] <= log_limit and cp["sig"] <= sig_limit:
         try:
-            for line in log_lines[-missing:]:
-                append_log_signature(f"{line}|UNKNOWN|INFO")
-            print(f"DEBUG: Auto-healed {missing} signatures")
-            return True, f"Auto-healed {missing}"
-        except Exception as e: 
-            print(f"❌ Auto-Heal Failed: {e}") # Print the error!
-            return False, f"Heal failed: {e}"
+            if (_hash_file_range(log_sha, LOG_FILE, 0, cp["log"])
+                    and _hash_file_range(sig_sha, LOG_SIG_FILE, 0, cp["sig"])
+                    and hmac.compare_digest(log_sha.hexdigest(), cp["log_sha"])
+                    and hmac.compare_digest(sig_sha.hexdigest(), cp["sig_sha"])):
+                log_start, sig_start, first_line = cp["log"], cp["sig"], cp["lines"]
+        except OSError:
+            pass
+        if not log_start:
+            log_sha, sig_sha = hashlib.sha256(), hashlib.sha256()
+
+    unsigned = []   # log lines past the end of the sig file (crash between the two writes)
+    checked = first_line
+    log_end, sig_end = log_start, sig_start
+    try:
+        sig_iter = _iter_log_lines(LOG_SIG_FILE, sig_limit, sig_start)
+        for i, (line_end, line) in enumerate(_iter_log_lines(LOG_FILE, log_limit, log_start), first_line):
+            sig_entry = next(sig_iter, None)
+            if sig_entry is None:
+                unsigned.append(line)
+                continue
+            sig_end, stored_sig = sig_entry
+            log_end = line_end
+            checked = i + 1
+
+            # Absorb the line into the keyed HMAC once, then try each allowed
+            # suffix on a copy: INFO / None first (no decrypt needed), and only
+            # then the severity parsed from the line's own badge.
+            try:
+                stored = bytes.fromhex(stored_sig)
+            except ValueError:
+                stored = b""
+            prefix = _line_hmac(line.encode("utf-8"))
+            ok = False
+            for suffix in _LOG_SIG_SUFFIXES:
+                h = prefix.copy()
+                h.update(suffix)
+                if hmac.compare_digest(h.digest(), stored):
+                    ok = True
+                    break
+            if not ok:
+                sev = _line_severity(line)
+                if sev != "INFO":
+                    h = prefix.copy()
+                    h.update(f"|UNKNOWN|{sev}".encode("utf-8"))
+                    ok = hmac.compare_digest(h.digest(), stored)
+            if not ok:
+                # FAIL
+                sig1 = _line_hmac(f"{line}|UNKNOWN|INFO".encode("utf-8")).hexdigest()
+                print(f"\n[DEBUG] SIGNATURE MISMATCH AT LINE {i+1}")
+                print(f"Content: {line}")
+                print(f"Expected 1 (INFO): {sig1}")
+                print(f"Found on Disk:   {stored_sig}")
+                
+                if handle_tamper_event: handle_tamper_event("signature", LOG_FILE)
+                return False, f"Signature Mismatch at line {i+1}"
+
+        extra_sig = next(sig_iter, None)
+    except (OSError, UnicodeDecodeError):
+        return False, "Read fail"
 
     # TAMPER (Deletion)
-    if len(log_lines) < len(sig_lines):
+    if extra_sig is not None:
         if handle_tamper_event: handle_tamper_event("logs", LOG_FILE)
         return False, "Deletion Detected"
 
-    # CONTENT VERIFICATION
-    # Ensure config is loaded
-    if "secret_key" not in CONFIG: load_config()
-    
-    key = _get_hmac_key()
-    h_factory = getattr(hashlib, CONFIG.get("hash_algo", "sha256"))
-    
-    for i, (line, stored_sig) in enumerate(zip(log_lines, sig_lines)):
-        # Strategy 1: Check Standard/Healed format (INFO)
-        check1 = f"{line}|UNKNOWN|INFO"
-        sig1 = hmac.new(key, check1.encode("utf-8"), h_factory).hexdigest()
-        
-        if stored_sig == sig1: continue
+    # Everything up to (log_end, sig_end) is verified — extend the checkpoint
+    if (log_end, sig_end) != (log_start, sig_start):
+        try:
+            if (_hash_file_range(log_sha, LOG_FILE, log_start, log_end)
+                    and _hash_file_range(sig_sha, LOG_SIG_FILE, sig_start, sig_end)):
+                _LOG_VERIFY_CHECKPOINT = {
+                    "log": log_end, "sig": sig_end, "lines": checked,
+                    "log_sha": log_sha.hexdigest(), "sig_sha": sig_sha.hexdigest(),
+                }
+                _save_log_checkpoint(_LOG_VERIFY_CHECKPOINT)
+        except OSError:
+            pass
 
-        # Strategy 2: Parse Severity from Decrypted Text
-        parsed_sev = "INFO"
-        
-        # 🚨 FIX 4: You must DECRYPT the line before looking for the Emoji!
-        decrypted = crypto_manager.decrypt_string(line)
-        
-        if "[🔴 CRITICAL]" in decrypted: parsed_sev = "CRITICAL"
-        elif "[🟠 HIGH]" in decrypted: parsed_sev = "HIGH"
-        elif "[🟡 MEDIUM]" in decrypted: parsed_sev = "MEDIUM"
-        
-        check2 = f"{line}|UNKNOWN|{parsed_sev}"
-        sig2 = hmac.new(key, check2.encode("utf-8"), h_factory).hexdigest()
+    # AUTO HEAL (Crash/Sync)
+    if unsigned:
+        with _LOG_IO_LOCK:
+            # Only heal if nothing was appended since the snapshot, otherwise
+            # the new sigs would land after lines they don't belong to.
+            try:
+                if (os.path.getsize(LOG_FILE) != log_limit
+                        or os.path.getsize(LOG_SIG_FILE) != sig_limit):
+                    return True, f"Signatures OK ({checked} lines, log still growing)"
+            except OSError:
+                pass
+            try:
+                for line in unsigned:
+                    append_log_signature(f"{line}|UNKNOWN|INFO")
+                print(f"DEBUG: Auto-healed {len(unsigned)} signatures")
+                return True, f"Auto-healed {len(unsigned)}"
+            except Exception as e: 
+                print(f"❌ Auto-Heal Failed: {e}") # Print the error!
+                return False, f"Heal failed: {e}"
 
-        if stored_sig == sig2: continue
+    return True, "Signatures OK"
 
-        # Strategy 3: The "None" Fallback
-        check3 = f"{line}|UNKNOWN|None"
-        sig3 = hmac.new(key, check3.encode("utf-8"), h_factory).hexdigest()
-        if stored_sig == sig3: continue
+# ------------------ Hashing (chunked + retry) ------------------
+_HASH_CTORS = {}
 
-        # FAIL
-        print(f"\n[DEBUG] SIGNATURE MISMATCH AT LINE {i+1}")
-        print(f"Content: {line}")
-        print(f"Expected 1 (INFO): {sig1}")
-        print(f"Found on Disk:   {stored_sig}")
-        
-        if handle_tamper_event: handle_tamper_event("signature", LOG_FILE)
-        return False, f"Signature Mismatch at line {i+1}"
+def _hash_ctor(algo_name):
+    """
+    Resolve the hashlib constructor for `algo_name` once and reuse it.
+    hashlib's sha* constructors are OpenSSL-backed, so SHA-NI / ARMv8 crypto
+    extensions are picked up automatically on CPUs that have them.
+    """
+    ctor = _HASH_CTORS.get(algo_name)
+    if ctor is None:
+        ctor = getattr(hashlib, algo_name)
+        _HASH_CTORS[algo_name] = ctor
+        print(f"[HASH] {algo_name} backend: {_hash_backend(ctor)}")
+    return ctor
+
+def _hash_backend(ctor):
+    """Describe which implementation a hashlib constructor dispatches to (startup log)."""
+    if getattr(ctor, "__module__", "") != "_hashlib":
+        return "builtin (no OpenSSL in this Python build)"
+    import ssl
+    desc = ssl.OPENSSL_VERSION
+    try:
+        # OpenSSL picks its SHA-NI code path itself; report whether the CPU has it
+        with open("/proc/cpuinfo", "r", encoding="utf-8", errors="ignore") as f:
+            flags = next((l for l in f if l.startswith(("flags", "Features"))), "").split()
+        desc += ", SHA extensions: " + ("yes" if {"sha_ni", "sha2"} & set(flags) else "no")
+    except OSError:
+        pass
+    return desc
 
-    return True, "Signatures OK"
+_IGNORE_MATCHER = (None, None)   # (cache key, compiled substring regex)
+
+def _ignore_regex():
+    """
+    One compiled alternation of config ignore_filenames + TEMP_PATTERNS
+    (substrings) and ignore_globs (whole-name wildcards).
+    Rebuilt only when the contents of CONFIG's ignore lists change.
+    """
+    global _IGNORE_MATCHER
+    patterns = CONFIG.get("ignore_filenames", []) or []
+    globs = CONFIG.get("ignore_globs", []) or []
+    # Keyed on the contents: ids can be reused after a config reload and a
+    # list edited in place keeps its id (and maybe its length)
+    key = (tuple(patterns), tuple(globs))
+    if _IGNORE_MATCHER[0] != key:
+        alts = sorted({p.lower() for p in patterns} | set(TEMP_PATTERNS), key=len, reverse=True)
+        regex = "|".join(re.escape(p) for p in alts)
+        if globs:
+            # fnmatch.translate anchors the end; \A anchors the start under search()
+            regex += r"|\A(?:" + "|".join(fnmatch.translate(g.lower()) for g in globs) + ")"
+        _IGNORE_MATCHER = (key, re.compile(regex))
+    return _IGNORE_MATCHER[1]
 
-# ------------------ Hashing (chunked + retry) ------------------
 def is_ignored_filename(name):
-    ln = name.lower()
-    # first config-based ignore substrings
-    for ig in CONFIG.get("ignore_filenames", []):
-        if ig.lower() in ln:
-            return True
-    # then temp patterns
-    for p in TEMP_PATTERNS:
-        if p in ln:
-            return True
-    return False
+    # config-based ignore substrings, globs + temp patterns in a single scan
+    return _ignore_regex().search(name.lower()) is not None
 
-def generate_file_hash(path):
+def _hash_mmap(f, algo):
     """
-    Chunked hashing + Advanced Metadata (Windows Attributes & Timestamps)
+    Feed an open file to `algo` through a read-only mmap (no userspace copy).
+    Returns False without touching `algo` if the file can't be mapped
+    (e.g. locked on Windows), so the caller falls back to chunked reads.
     """
-    fn = os.path.basename(path)
-    if is_ignored_filename(fn):
-        return None
-        
-    chunk_size = CONFIG.get("hash_chunk_size", 65536)
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    with mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            except OSError:
+                pass
+        algo.update(mm)
+    return True
+
+def _fadvise(f, advice):
+    """Best-effort posix_fadvise over the whole file (no-op where unsupported, e.g. Windows)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+    except (OSError, AttributeError):
+        pass
+
+def _stat_fingerprint(st):
+    """
+    Cheap change fingerprint stored with each record: size, mtime, ctime
+    (inode change time on POSIX, which can't be set back) and attributes.
+    On Windows st_ctime is the creation time and can be set like mtime, so
+    there the fingerprint is NOT tamper-evidence — see scan_skip_unchanged.
+    """
+    return [st.st_size, st.st_mtime_ns, st.st_ctime_ns,
+            getattr(st, 'st_file_attributes', st.st_mode)]
+
+_HASH_BUF_TLS = threading.local()
+
+def _hash_read_buffer(size):
+    """Per-thread reusable (bytearray, memoryview) for readinto-based hashing."""
+    size = max(4096, int(size))
+    buf = getattr(_HASH_BUF_TLS, "buf", None)
+    if buf is None or len(buf) != size:
+        buf = bytearray(size)
+        _HASH_BUF_TLS.buf = buf
+        _HASH_BUF_TLS.view = memoryview(buf)
+    return buf, _HASH_BUF_TLS.view
+
+def make_file_hasher():
+    """
+    Build a file hasher specialised for the current CONFIG (chunk size, algo,
+    retries, mmap threshold are read once here, not per file).
+    Bulk scans build one per sweep; settings changed later apply to the next one.
+    """
+    chunk_size = CONFIG.get("hash_chunk_size", 1024 * 1024)
     retries = CONFIG.get("hash_retries", 3)
     delay = CONFIG.get("hash_retry_delay", 0.5)
-    algo_name = CONFIG.get("hash_algo", "sha256")
-    
-    for attempt in range(1, retries + 1):
-        try:
-            algo = getattr(hashlib, algo_name)()
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk: break
-                    algo.update(chunk)
-            content_hash = algo.hexdigest()
-            
-            stats = os.stat(path)
-            attributes = getattr(stats, 'st_file_attributes', stats.st_mode)
-            mtime = stats.st_mtime
-            
-            meta_string = f"{attributes}_{mtime}"
-            final_hash = hashlib.sha256(f"{content_hash}|{meta_string}".encode()).hexdigest()
-            
-            # ALWAYS return the detailed dictionary
-            return {"hash": final_hash, "content": content_hash, "attrs": attributes}
-            
-        except (PermissionError, FileNotFoundError):
-            if attempt < retries:
-                time.sleep(delay)
-                continue
-            return None
-        except Exception as e:
-            append_log_line(f"ERROR_HASH: {path} ({e})")
+    mmap_threshold = CONFIG.get("mmap_threshold", 4 * 1024 * 1024)
+    hash_ctor = _hash_ctor(CONFIG.get("hash_algo", "sha256"))
+    ignored = is_ignored_filename
+    basename, fstat, sha256 = os.path.basename, os.fstat, hashlib.sha256
+
+    def hash_file(path):
+        """
+        Chunked hashing + Advanced Metadata (Windows Attributes & Timestamps)
+        """
+        if ignored(basename(path)):
             return None
 
+        buf, view = _hash_read_buffer(chunk_size)
+        for attempt in range(1, retries + 1):
+            try:
+                algo = hash_ctor()
+                with open(path, "rb") as f:
+                    stats = fstat(f.fileno())
+                    # Typical trees are mostly small files: for anything that fits
+                    # one read buffer, skip the readahead/cache hints (2 syscalls
+                    # that cost more than they save on a single read)
+                    multi_chunk = stats.st_size > chunk_size
+                    if multi_chunk:
+                        _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+                    # Large files: let hashlib read straight from the page cache
+                    if not (mmap_threshold and stats.st_size >= mmap_threshold
+                            and _hash_mmap(f, algo)):
+                        while True:
+                            n = f.readinto(buf)
+                            if not n: break
+                            algo.update(view[:n])
+                    # Don't leave a full sweep's worth of files in the page cache
+                    if multi_chunk:
+                        _fadvise(f, "POSIX_FADV_DONTNEED")
+                content_hash = algo.hexdigest()
+                
+                attributes = getattr(stats, 'st_file_attributes', stats.st_mode)
+                mtime = stats.st_mtime
+                
+                meta_string = f"{attributes}_{mtime}"
+                final_hash = sha256(f"{content_hash}|{meta_string}".encode()).hexdigest()
+                
+                # ALWAYS return the detailed dictionary
+                return {"hash": final_hash, "content": content_hash, "attrs": attributes,
+                        "fp": _stat_fingerprint(stats)}
+                
+            except (PermissionError, FileNotFoundError):
+                if attempt < retries:
+                    time.sleep(delay)
+                    continue
+                return None
+            except Exception as e:
+                append_log_line(f"ERROR_HASH: {path} ({e})")
+                return None
+
+    return hash_file
+
+def generate_file_hash(path):
+    """
+    Chunked hashing + Advanced Metadata (Windows Attributes & Timestamps)
+    """
+    return make_file_hasher()(path)
+
+def hash_files_concurrently(paths, max_inflight=None):
+    """
+    Hash many files on a thread pool and yield (path, details) as each one finishes.
+
+    Only `max_inflight` reads are queued at any moment (CONFIG "scan_max_inflight",
+    default 64), so a 100k-file tree no longer creates 100k futures up front.
+    `details` is None when the file was skipped or hashing raised.
+    """
+    # Each worker keeps one blocking read outstanding, so the thread count is
+    # the effective device queue depth (raise it for NVMe, lower for HDDs)
+    max_threads = CONFIG.get("scan_io_depth") or min(32, (os.cpu_count() or 1) * 4)
+    max_threads = max(1, int(max_threads))
+    if max_inflight is None:
+        max_inflight = CONFIG.get("scan_max_inflight", 64)
+    max_inflight = max(max_threads, int(max_inflight))
+
+    hash_file = make_file_hasher()   # settings frozen for this batch
+    path_iter = iter(paths)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+        pending = {}
+        for p in itertools.islice(path_iter, max_inflight):
+            pending[executor.submit(hash_file, p)] = p
+
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    details = future.result()
+                except Exception as exc:
+                    print(f"File {path} generated an exception: {exc}")
+                    details = None
+
+                # Refill the window before handing the result back
+                nxt = next(path_iter, None)
+                if nxt is not None:
+                    pending[executor.submit(hash_file, nxt)] = nxt
+
+                yield path, details
+
 # ------------------ Webhook safe sender ------------------
+_WEBHOOK_QUEUE = queue.Queue(maxsize=1024)
+_WEBHOOK_WORKER = None
+_WEBHOOK_WORKER_LOCK = threading.Lock()
+
+
+def _webhook_worker():
+    """Drain the webhook queue over one keep-alive session (TCP/TLS reused)."""
+    session = requests.Session()
+    while True:
+        url, payload = _WEBHOOK_QUEUE.get()
+        try:
+            session.post(url, json=payload, timeout=3)
+        except Exception as e:
+            print(f"Webhook delivery failed: {e}")
+
+
+def _enqueue_webhook(url, payload):
+    """Non-blocking hand-off; drops the oldest pending alert when the queue is full."""
+    global _WEBHOOK_WORKER
+    if requests is None:
+        return
+    with _WEBHOOK_WORKER_LOCK:
+        if _WEBHOOK_WORKER is None or not _WEBHOOK_WORKER.is_alive():
+            _WEBHOOK_WORKER = threading.Thread(target=_webhook_worker, daemon=True)
+            _WEBHOOK_WORKER.start()
+    try:
+        _WEBHOOK_QUEUE.put_nowait((url, payload))
+    except queue.Full:
+        try:
+            _WEBHOOK_QUEUE.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            _WEBHOOK_QUEUE.put_nowait((url, payload))
+        except queue.Full:
+            pass
+
+
 def send_webhook_safe(event_type, message, filepath=None, severity="INFO"):
     """
     DUAL-CHANNEL ALERT PIPELINE:
@@ -825,39 +1384,32 @@ def send_webhook_safe(event_type, message, filepath=None, severity="INFO"):
     # --- CHANNEL 1: DISCORD/SLACK WEBHOOK (Incident Response) ---
     # if webhook_url: -> iss se sare chhezon par alert aayega kuch bhi karenge toh
     if webhook_url and severity in ["CRITICAL", "HIGH"]:
-        def _post_webhook():
-            try:
-                # Build the Enterprise Rich Embed JSON
-                payload = {
-                    "username": "FMSecure EDR Agent",
-                    "avatar_url": "https://cdn-icons-png.flaticon.com/512/2092/2092663.png",
-                    "embeds": [{
-                        "title": f"🚨 SECURITY ALERT: {event_type}",
-                        "description": message,
-                        "color": color,
-                        "fields": [
-                            {"name": "Severity", "value": severity, "inline": True},
-                            {"name": "Timestamp", "value": now_pretty(), "inline": True}
-                        ],
-                        "footer": {"text": "Endpoint Detection & Response Module"}
-                    }]
-                }
-                
-                # Add filepath to the card if one exists
-                if filepath:
-                    payload["embeds"][0]["fields"].append({
-                        "name": "Target File", 
-                        "value": f"`{filepath}`", 
-                        "inline": False
-                    })
-
-                # Fire the HTTP POST request to Discord
-                requests.post(webhook_url, json=payload, timeout=3)
-            except Exception as e:
-                print(f"Webhook delivery failed: {e}")
-                
-        # Run in a background thread so it doesn't freeze the monitor!
-        threading.Thread(target=_post_webhook, daemon=True).start()
+        # Build the Enterprise Rich Embed JSON
+        payload = {
+            "username": "FMSecure EDR Agent",
+            "avatar_url": "https://cdn-icons-png.flaticon.com/512/2092/2092663.png",
+            "embeds": [{
+                "title": f"🚨 SECURITY ALERT: {event_type}",
+                "description": message,
+                "color": color,
+                "fields": [
+                    {"name": "Severity", "value": severity, "inline": True},
+                    {"name": "Timestamp", "value": now_pretty(), "inline": True}
+                ],
+                "footer": {"text": "Endpoint Detection & Response Module"}
+            }]
+        }
+        
+        # Add filepath to the card if one exists
+        if filepath:
+            payload["embeds"][0]["fields"].append({
+                "name": "Target File", 
+                "value": f"`{filepath}`", 
+                "inline": False
+            })
+
+        # Hand off to the delivery worker so it doesn't freeze the monitor!
+        _enqueue_webhook(webhook_url, payload)
 
     # --- CHANNEL 2: COMPLIANCE EMAIL (Audit Trail) ---
     if admin_email and severity in ["CRITICAL", "HIGH"]:
@@ -899,9 +1451,53 @@ def send_webhook_safe(event_type, message, filepath=None, severity="INFO"):
             pass   # never block the existing alert pipeline
 
 # ------------------ Verification & Summary ------------------
-def verify_all_files_and_update(records=None, watch_folders=None):
+def iter_watched_entries(watch_folders):
+    """
+    Yield an os.DirEntry for every non-ignored file under `watch_folders`.
+
+    Each watch root is made absolute once, so entry.path is already absolute.
+    Entries carry their type (and, on Windows, their stat) from the directory
+    listing, so callers can use entry.stat() instead of a second os.stat.
+    """
+    # Prune ignored directories (both default and user-configured)
+    custom_ignored = set(CONFIG.get("ignored_dirs", []))
+
+    for folder in watch_folders:
+        if not os.path.exists(folder): continue
+        stack = [os.path.abspath(folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue   # same as os.walk: unreadable dirs are skipped
+
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Keep directories that are NOT in our ignore lists AND do NOT contain pyvenv.cfg
+                    name = entry.name
+                    if (name in IGNORED_DIRS or name in custom_ignored
+                            or entry.is_symlink()
+                            or os.path.isfile(os.path.join(entry.path, "pyvenv.cfg"))):
+                        continue
+                    stack.append(entry.path)
+                elif not is_ignored_filename(entry.name):
+                    yield entry
+
+def iter_watched_files(watch_folders):
+    """Yield the absolute path of every non-ignored file under `watch_folders`."""
+    for entry in iter_watched_entries(watch_folders):
+        yield entry.path
+
+def verify_all_files_and_update(records=None, watch_folders=None, save_records=None):
     """
     Full scan: verify all files in multiple watch_folders against records.
+    `save_records` persists the result instead of save_hash_records(records);
+    pass the live handler's flush_records so its single writer does the save.
     """
     print("DEBUG: Starting verify_all_files_and_update")
     
@@ -919,61 +1515,62 @@ def verify_all_files_and_update(records=None, watch_folders=None):
     modified = []
     skipped = []
     
-    # 1. Gather all files
-    paths_to_scan = []
-    for folder in watch_folders:
-        if not os.path.exists(folder): continue
-        for root, dirs, files in os.walk(folder):
-            # Prune ignored directories (both default and user-configured)
-            custom_ignored = set(CONFIG.get("ignored_dirs", []))
-            
-            # Keep directories that are NOT in our ignore lists AND do NOT contain pyvenv.cfg
-            dirs[:] = [
-                d for d in dirs 
-                if d not in IGNORED_DIRS 
-                and d not in custom_ignored
-                and not os.path.isfile(os.path.join(root, d, "pyvenv.cfg"))
-            ]
-
-            for fn in files:
-                if is_ignored_filename(fn): continue
-                path = os.path.abspath(os.path.join(root, fn))
-                seen.add(path)
-                paths_to_scan.append(path)
-
-    # 2. Parallel Processing
-    max_threads = min(32, (os.cpu_count() or 1) * 4)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
-        future_to_path = {executor.submit(generate_file_hash, p): p for p in paths_to_scan}
-        
-        for future in concurrent.futures.as_completed(future_to_path):
-            path = future_to_path[future]
-            try:
-                details = future.result()
-                if details is None:
-                    skipped.append(path)
-                    continue
-                    
-                h = details["hash"]
-                old_hash = records.get(path, {}).get("hash")
-                
-                if not old_hash:
-                    records[path] = {"hash": h, "content": details["content"], "attrs": details["attrs"], "last_checked": now_pretty()}
-                    created.append(path)
-                elif old_hash != h:
-                    records[path] = {"hash": h, "content": details["content"], "attrs": details["attrs"], "last_checked": now_pretty()}
-                    modified.append(path)
-                else:
-                    records[path]["last_checked"] = now_pretty()
-            except Exception as exc:
-                skipped.append(path)
+    # 1. Gather files lazily so the directory walk overlaps with hashing.
+    #    Files whose stat fingerprint matches the (HMAC-protected) record are
+    #    not re-read at all.
+    skip_unchanged = CONFIG.get("scan_skip_unchanged", os.name != "nt")
+    # One timestamp per sweep: strftime per file was a measurable share of
+    # the compare loop on large, mostly-unchanged trees.
+    checked_at = now_pretty()
+
+    def _scan_paths():
+        get_record, mark_seen = records.get, seen.add
+        for entry in iter_watched_entries(watch_folders):
+            path = entry.path
+            mark_seen(path)
+            rec = get_record(path) if skip_unchanged else None
+            if rec:
+                fp = rec.get("fp")
+                if fp:
+                    try:
+                        # DirEntry.stat() is free on Windows (came with the listing)
+                        if _stat_fingerprint(entry.stat()) == fp:
+                            rec["last_checked"] = checked_at
+                            continue
+                    except OSError:
+                        pass
+            yield path
+
+    # 2. Parallel Processing (bounded in-flight window, see hash_files_concurrently)
+    # Results are consumed here on the calling thread, so `records` needs no lock.
+    for path, details in hash_files_concurrently(_scan_paths()):
+        if details is None:
+            skipped.append(path)
+            continue
+
+        h = details["hash"]
+        rec = records.get(path)
+        old_hash = rec.get("hash") if rec else None
+
+        if old_hash == h:
+            # Unchanged content: refresh the fingerprint in place, no new dict
+            rec["fp"] = details["fp"]
+            rec["last_checked"] = checked_at
+            continue
+
+        records[path] = {"hash": h, "content": details["content"], "attrs": details["attrs"], "fp": details["fp"], "last_checked": checked_at}
+        (modified if old_hash else created).append(path)
     
-    # detect deleted (files in records but not in seen)
-    deleted = [p for p in list(records.keys()) if p not in seen and not is_ignored_filename(os.path.basename(p))]
+    # detect deleted (files in records but not in seen) — one C-level set
+    # difference instead of a Python membership test per record
+    deleted = sorted(p for p in records.keys() - seen if not is_ignored_filename(os.path.basename(p)))
     for p in deleted:
         records.pop(p, None)
     
-    save_hash_records(records)
+    if save_records is not None:
+        save_records()
+    else:
+        save_hash_records(records)
     
     records_ok = verify_records_signature_on_disk()
     logs_ok, logs_detail = verify_log_signatures()
@@ -1053,6 +1650,9 @@ def write_report_summary(summary):
         traceback.print_exc()
 
 
+_HMAC_KEY_CACHE = None
+_LINE_HMAC_BASE = {}   # hash_algo -> keyed HMAC template (pads precomputed)
+
 def _get_hmac_key() -> bytes:
     """
     Returns the HMAC signing key.
@@ -1061,14 +1661,19 @@ def _get_hmac_key() -> bytes:
       2. From users.dat (encrypted storage)
       3. Fallback hardcoded default (only if both above fail — warns loudly)
     Never reads from config.json.
+    The PBKDF2 derivation is done once per process and cached.
     """
+    global _HMAC_KEY_CACHE
+    if _HMAC_KEY_CACHE is not None:
+        return _HMAC_KEY_CACHE
     try:
         from core.encryption_manager import crypto_manager
         # Derive from machine KEK — stable across reboots, unique per device
         # PBKDF2 over the machine_id gives a deterministic 32-byte HMAC key
         import hashlib
         mid = crypto_manager.get_machine_id().encode("utf-8")
-        return hashlib.pbkdf2_hmac("sha256", mid, b"fmsecure_hmac_salt_v1", 100_000)
+        _HMAC_KEY_CACHE = hashlib.pbkdf2_hmac("sha256", mid, b"fmsecure_hmac_salt_v1", 100_000)
+        return _HMAC_KEY_CACHE
     except Exception:
         pass
     # Last resort
@@ -1076,6 +1681,21 @@ def _get_hmac_key() -> bytes:
     return b"FMSecure_Default_HMAC_Key_v1_Change_Me"
 
 
+def _line_hmac(data: bytes):
+    """
+    Keyed HMAC over one log line. The key schedule is computed once per
+    hash_algo; each call just clones that state with .copy().
+    """
+    algo = CONFIG.get("hash_algo", "sha256")
+    base = _LINE_HMAC_BASE.get(algo)
+    if base is None:
+        base = hmac.new(_get_hmac_key(), b"", _hash_ctor(algo))
+        _LINE_HMAC_BASE[algo] = base
+    h = base.copy()
+    h.update(data)
+    return h
+
+
 class _SystemPathRateLimiter:
     """
     Prevents system path events from flooding the event queue.
@@ -1099,6 +1719,29 @@ class _SystemPathRateLimiter:
  
 _sys_path_limiter = _SystemPathRateLimiter(min_interval=3.0)
 
+
+def _abs_event_path(src_path):
+    """
+    Watches are scheduled on normalised absolute roots, so watchdog already
+    hands us absolute, normalised paths — skip abspath's normpath (and, for
+    relative input, getcwd) on the per-event path unless it is really needed.
+    """
+    return src_path if os.path.isabs(src_path) else os.path.abspath(src_path)
+
+def _event_path(src_path):
+    """
+    Shared prologue of the on_created/on_modified/on_deleted handlers.
+    Returns the absolute path, or None if the event should be dropped
+    (ignored filename, or a rate-limited system path).
+    """
+    path = _abs_event_path(src_path)
+    if is_ignored_filename(os.path.basename(path)):
+        return None
+    # Rate-limit events from system paths to prevent flooding
+    if is_system_critical(path) and not _sys_path_limiter.should_process(path):
+        return None  # Too many events from this system path, skip
+    return path
+
 # ------------------ Watchdog event handler ------------------
 class IntegrityHandler(FileSystemEventHandler):
     def __init__(self, watch_folders=None, callback=None):  # Changed to watch_folders
@@ -1127,68 +1770,45 @@ class IntegrityHandler(FileSystemEventHandler):
 
         # Initial scan to populate missing files for ALL folders
         # Initial scan to populate missing files for ALL folders
-        paths_to_hash = []
-        
-        # 1. Quickly gather all file paths first (Disk is fast at listing files)
-        for folder in self.watch_folders:
-            if not os.path.exists(folder): continue
-            for root, dirs, files in os.walk(folder):
-                # Prune ignored directories (both default and user-configured)
-                custom_ignored = set(CONFIG.get("ignored_dirs", []))
-                
-                # Keep directories that are NOT in our ignore lists AND do NOT contain pyvenv.cfg
-                dirs[:] = [
-                    d for d in dirs 
-                    if d not in IGNORED_DIRS 
-                    and d not in custom_ignored
-                    and not os.path.isfile(os.path.join(root, d, "pyvenv.cfg"))
-                ]
-                
-                for fn in files:
-                    if is_ignored_filename(fn): continue
-                    path = os.path.abspath(os.path.join(root, fn))
-                    
-                    # Only queue files that aren't already in the database
-                    if path not in self.records:
-                        paths_to_hash.append(path)
+        # 1. Stream the scandir walk straight into the hashing pool, so workers
+        #    start on the first new file instead of waiting for the full listing.
+        #    Only files that aren't already in the database are queued.
+        records = self.records
+        new_paths = (p for p in iter_watched_files(self.watch_folders) if p not in records)
+        first = next(new_paths, None)
 
         # 2. Hash files concurrently (CPU/SSD multi-core processing)
         initial_added = False
-        if paths_to_hash:
-            append_log_line(f"Starting parallel baseline scan for {len(paths_to_hash)} new files...")
-            
-            # Use a ThreadPool to process multiple files at the exact same time
-            max_threads = min(32, (os.cpu_count() or 1) * 4) 
+        if first is not None:
+            append_log_line("Starting parallel baseline scan for new files...")
+            checked_at = now_pretty()
+            backup = CONFIG.get("active_defense", False)
+            vault_max_mb = CONFIG.get("vault_max_size_mb", 10)
+            _allowed = CONFIG.get("vault_allowed_exts") or None   # [] → None (allow all)
+            added = 0
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
-                # Submit all files to the thread pool
-                future_to_path = {executor.submit(generate_file_hash, p): p for p in paths_to_hash}
-                
-                # As each file finishes hashing, save it to the database
-                for future in concurrent.futures.as_completed(future_to_path):
-                    path = future_to_path[future]
-                    try:
-                        details = future.result()
-                        if details:
-                            self.records[path] = {
-                                "hash": details["hash"], 
-                                "content": details["content"], 
-                                "attrs": details["attrs"], 
-                                "last_checked": now_pretty()
-                            }
-                            initial_added = True
-
-                            # --- NEW: BACKUP THE SAFE BASELINE ---
-                            if CONFIG.get("active_defense", False):
-                                _allowed = CONFIG.get("vault_allowed_exts") or None   # [] → None (allow all)
-                                vault.backup_file(path,
-                                                  CONFIG.get("vault_max_size_mb", 10),
-                                                  _allowed)
-                    except Exception as exc:
-                        print(f"File {path} generated an exception: {exc}")
-                    
+            # As each file finishes hashing, save it to the database
+            for path, details in hash_files_concurrently(itertools.chain((first,), new_paths)):
+                if not details:
+                    continue
+                try:
+                    records[path] = {
+                        "hash": details["hash"], 
+                        "content": details["content"], 
+                        "attrs": details["attrs"], 
+                        "fp": details["fp"],
+                        "last_checked": checked_at
+                    }
+                    initial_added = True
+                    added += 1
+
+                    # --- NEW: BACKUP THE SAFE BASELINE ---
+                    if backup:
+                        vault.backup_file(path, vault_max_mb, _allowed)
+                except Exception as exc:
+                    print(f"File {path} generated an exception: {exc}")
                         
-            append_log_line("Parallel baseline scan completed.")
+            append_log_line(f"Parallel baseline scan completed ({added} new files).")
 
         if initial_added:
             save_hash_records(self.records)
@@ -1200,6 +1820,18 @@ class IntegrityHandler(FileSystemEventHandler):
         # ── Restore cooldown: prevents the same file being re-restored within 10s ──
         # key = absolute path, value = timestamp of last restore
         self._restore_cooldown: dict = {}
+        # ── Modification debounce: one pending timer per path ──
+        self.modified_timers: dict = {}
+        self.created_timers: dict = {}   # path -> settle Timer for fresh files
+        self._timers_lock = threading.Lock()
+        # ── Record persistence: events only mark records dirty; one writer
+        #    thread saves them at most once per records_save_delay ──
+        self._records_dirty = threading.Event()
+        self._save_lock = threading.Lock()
+        self._last_save_secs = 0.0
+        self._writer_closed = False
+        self._writer_thread = threading.Thread(target=self._records_writer_loop, daemon=True)
+        self._writer_thread.start()
 
     def _notify_gui(self, event_type, path, severity):
         """
@@ -1326,7 +1958,44 @@ class IntegrityHandler(FileSystemEventHandler):
         return True
 
     def save_records(self):
-        save_hash_records(self.records)
+        """Mark records dirty; the writer thread persists them (bursts cost one write)."""
+        if not CONFIG.get("records_save_delay", 0.1):
+            self._write_records()
+            return
+        self._records_dirty.set()
+
+    def _write_records(self):
+        # Snapshot + save under one lock so an older snapshot never lands last.
+        # Shallow copy is atomic, so event threads can keep adding paths meanwhile.
+        with self._save_lock:
+            t0 = time.perf_counter()
+            save_hash_records(self.records.copy())
+            self._last_save_secs = time.perf_counter() - t0
+
+    def _records_writer_loop(self):
+        while not self._writer_closed:
+            self._records_dirty.wait()
+            if self._writer_closed:
+                break
+            # Let the burst settle. A save re-encodes the whole vault, so for
+            # large trees stretch the window until saving takes at most
+            # records_save_duty of wall time (100k files: one write, not a storm).
+            delay = CONFIG.get("records_save_delay", 0.1)
+            duty = CONFIG.get("records_save_duty", 0.2)
+            if duty and 0 < duty < 1:
+                delay = max(delay, min(30.0, self._last_save_secs * (1 - duty) / duty))
+            time.sleep(delay)
+            self._records_dirty.clear()
+            self._write_records()
+
+    def flush_records(self, close=False):
+        """Write the current records now; `close=True` also stops the writer thread."""
+        if close:
+            self._writer_closed = True
+        self._records_dirty.clear()
+        self._write_records()
+        if close:
+            self._records_dirty.set()   # wake the writer so it sees _writer_closed
 
     def _trigger_honeypot(self, path):
         """Instantly detonates the Killswitch if the decoy file is touched"""
@@ -1345,13 +2014,55 @@ class IntegrityHandler(FileSystemEventHandler):
 
     def on_created(self, event):
         if event.is_directory: return
-        path = os.path.abspath(event.src_path)
-        if is_ignored_filename(os.path.basename(path)): return
-        # Rate-limit events from system paths to prevent flooding
-        from core.system_paths import is_system_critical as _isc
-        if _isc(path) and not _sys_path_limiter.should_process(path):
-            return  # Too many events from this system path, skip
-        
+        path = _event_path(event.src_path)
+        if path is None: return
+        # Already baselined with this exact (size, mtime, ctime, attrs): a
+        # duplicate/spurious create – nothing to hash or report
+        if self._matches_record(path): return
+
+        if CONFIG.get("create_settle_sec", 0.3) > 0:
+            self._schedule_created(path)
+        else:
+            self._handle_created(path)
+
+    def _schedule_created(self, path):
+        """
+        A created file is usually still being written and followed by a burst
+        of `modified` events: wait until (size, mtime) holds still for the
+        settle window, then hash it ONCE as a creation.
+        """
+        try:
+            st = os.stat(path)
+            snap = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            snap = None
+        with self._timers_lock:
+            old = self.created_timers.get(path)
+            if old:
+                old.cancel()
+            timer = threading.Timer(CONFIG.get("create_settle_sec", 0.3),
+                                    self._settle_created, args=[path, snap])
+            timer.daemon = True
+            self.created_timers[path] = timer
+            timer.start()
+
+    def _settle_created(self, path, snap):
+        with self._timers_lock:
+            if self.created_timers.get(path) is not threading.current_thread():
+                return   # superseded by a newer event for this path
+            del self.created_timers[path]
+        try:
+            st = os.stat(path)
+        except OSError:
+            return   # created and removed again before it settled
+        if (st.st_size, st.st_mtime_ns) != snap:
+            self._schedule_created(path)   # still being written
+            return
+        self._handle_created(path)
+
+    def _handle_created(self, path):
+        """Hash a (settled) new file and run the creation pipeline."""
+        if self._matches_record(path): return
         details = generate_file_hash(path)
         if details:
             # --- FIX: GHOST CREATION INTERCEPT ---
@@ -1360,6 +2071,9 @@ class IntegrityHandler(FileSystemEventHandler):
             old_record = self.records.get(path)
             if old_record and old_record.get("content") == details["content"]:
                 self.records[path]["attrs"] = details["attrs"]
+                # Re-pin the fingerprint so later create events on the restored
+                # copy can short-circuit where the fingerprint is trusted
+                self.records[path]["fp"] = details["fp"]
                 self.records[path]["last_checked"] = now_pretty()
                 self.save_records()
                 return # Stop here! Do not log a duplicate creation.
@@ -1369,6 +2083,7 @@ class IntegrityHandler(FileSystemEventHandler):
                 "hash": details["hash"], 
                 "content": details["content"], 
                 "attrs": details["attrs"], 
+                "fp": details["fp"],
                 "last_checked": now_pretty()
             }
             self.save_records()
@@ -1428,48 +2143,89 @@ class IntegrityHandler(FileSystemEventHandler):
     def on_modified(self, event):
         """Catches modification events and queues them to prevent spam during file transfers"""
         if event.is_directory: return
-        path = os.path.abspath(event.src_path)
-        if is_ignored_filename(os.path.basename(path)): return
-        # Rate-limit events from system paths to prevent flooding
-        from core.system_paths import is_system_critical as _isc
-        if _isc(path) and not _sys_path_limiter.should_process(path):
-            return  # Too many events from this system path, skip
+        path = _event_path(event.src_path)
+        if path is None: return
 
         # --- 🚨 NEW: HONEYPOT TRIPWIRE 🚨 ---
         if os.path.basename(path).lower() == "secret_passwords.txt":
             self._trigger_honeypot(path)
             return
+
+        # No stat-fingerprint shortcut here: a real modify event is always
+        # hashed (size/mtime/ctime can be forged on Windows). Duplicate events
+        # of one burst are coalesced by the debounce below instead.
+
+        # Still inside a fresh file's settle window: extend it instead of
+        # hashing the half-written file (and logging it as MODIFIED) later
+        with self._timers_lock:
+            settling = path in self.created_timers
+        if settling:
+            self._schedule_created(path)
+            return
         
-        # 1. Initialize the debounce timer dictionary if it doesn't exist
-        if not hasattr(self, 'modified_timers'):
-            self.modified_timers = {}
-            
-        # 2. If a timer is already running for this file, cancel it (reset the clock)
-        if path in self.modified_timers:
-            self.modified_timers[path].cancel()
-            
-        # 3. Start a new 2.0 second countdown
-        timer = threading.Timer(2.0, self._process_stable_modification, args=[path])
-        self.modified_timers[path] = timer
-        timer.start()
+        self._schedule_modification(path)
+
+    def _matches_record(self, path, st=None):
+        """
+        True if `path`'s stat fingerprint still equals the one stored with its record.
+        Always False where the fingerprint isn't trusted (scan_skip_unchanged,
+        off by default on Windows), the same rule the full scan follows.
+        """
+        if not CONFIG.get("scan_skip_unchanged", os.name != "nt"):
+            return False
+        old_fp = self.records.get(path, {}).get("fp")
+        if not old_fp:
+            return False
+        try:
+            return _stat_fingerprint(st or os.stat(path)) == old_fp
+        except OSError:
+            return False
+
+    def _schedule_modification(self, path):
+        """
+        Per-path debounce: (re)start the countdown for `path`.
+        Every event inside the window resets the clock, so a burst of
+        saves produces exactly one hash when the file goes quiet.
+        """
+        delay = CONFIG.get("modify_debounce_sec", 2.0)
+        with self._timers_lock:
+            # If a timer is already running for this file, cancel it (reset the clock)
+            old = self.modified_timers.get(path)
+            if old:
+                old.cancel()
+            timer = threading.Timer(delay, self._process_stable_modification, args=[path])
+            timer.daemon = True
+            self.modified_timers[path] = timer
+            timer.start()
 
     def _process_stable_modification(self, path):
         """Only runs when the file has stopped emitting modification events"""
+        # The timer that fired is done — drop it so the dict doesn't grow forever
+        with self._timers_lock:
+            if self.modified_timers.get(path) is threading.current_thread():
+                del self.modified_timers[path]
         
-        # 1. STABILITY CHECK: Make absolutely sure the file size has stopped growing
         try:
-            size1 = os.path.getsize(path)
-            time.sleep(1.0)
-            size2 = os.path.getsize(path)
-            if size1 != size2:
-                # The file is still actively downloading/transferring!
-                # Re-queue the timer and wait again.
-                timer = threading.Timer(2.0, self._process_stable_modification, args=[path])
-                self.modified_timers[path] = timer
-                timer.start()
-                return
+            st = os.stat(path)
         except OSError:
-            return # The file was deleted mid-transfer, abort.
+            return # The file was deleted before the quiet period ended.
+
+        # 1. STABILITY CHECK: Make absolutely sure the file size has stopped growing.
+        # A file whose mtime is already older than the debounce window has been
+        # quiet the whole time -> no need to park this thread for another second.
+        quiet_for = time.time() - st.st_mtime
+        if quiet_for < CONFIG.get("modify_debounce_sec", 2.0):
+            try:
+                size1 = st.st_size
+                time.sleep(1.0)
+                size2 = os.path.getsize(path)
+                if size1 != size2:
+                    # The file is still actively downloading/transferring!
+                    # Re-queue the timer and wait again.
+                    self._schedule_modification(path)
+                    return
+            except OSError:
+                return # The file was deleted mid-transfer, abort.
             
         # 2. THE FILE IS STABLE! Now we safely perform the heavy hashing logic.
         details = generate_file_hash(path)
@@ -1483,7 +2239,7 @@ class IntegrityHandler(FileSystemEventHandler):
         old_hash = old_record.get("hash")
         
         if not old_hash:
-            self.records[path] = {"hash": h, "content": new_content, "attrs": new_attrs, "last_checked": now_pretty()}
+            self.records[path] = {"hash": h, "content": new_content, "attrs": new_attrs, "fp": details["fp"], "last_checked": now_pretty()}
             self.save_records()
             append_log_line(f"CREATED_ON_MODIFY: {path}", event_type="CREATED_ON_MODIFY", severity="INFO")
             self._notify_gui("CREATED", path, "INFO")
@@ -1519,6 +2275,7 @@ class IntegrityHandler(FileSystemEventHandler):
                                 "hash":         restored_details["hash"],
                                 "content":      restored_details["content"],
                                 "attrs":        restored_details["attrs"],
+                                "fp":           restored_details["fp"],
                                 "last_checked": now_pretty()
                             }
                             self.save_records()
@@ -1552,7 +2309,7 @@ class IntegrityHandler(FileSystemEventHandler):
             elif old_content and old_content != new_content:
                 log_detail = " (Content modified)"
             
-            self.records[path] = {"hash": h, "content": new_content, "attrs": new_attrs, "last_checked": now_pretty()}
+            self.records[path] = {"hash": h, "content": new_content, "attrs": new_attrs, "fp": details["fp"], "last_checked": now_pretty()}
             self.save_records()
             
             # ── Gap 1: Process Attribution ────────────────────────────────────
@@ -1623,13 +2380,9 @@ class IntegrityHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        path = os.path.abspath(event.src_path)
-        if is_ignored_filename(os.path.basename(path)):
+        path = _event_path(event.src_path)
+        if path is None:
             return
-        # Rate-limit events from system paths to prevent flooding
-        from core.system_paths import is_system_critical as _isc
-        if _isc(path) and not _sys_path_limiter.should_process(path):
-            return  # Too many events from this system path, skip
 
         # --- 🚨 HONEYPOT TRIPWIRE 🚨 ---
         if os.path.basename(path).lower() == "secret_passwords.txt":
@@ -1823,8 +2576,8 @@ class IntegrityHandler(FileSystemEventHandler):
         """Handle file renames with 'Safe Save' / Editor awareness"""
         if event.is_directory: return
         
-        src_path = os.path.abspath(event.src_path)
-        dest_path = os.path.abspath(event.dest_path)
+        src_path = _abs_event_path(event.src_path)
+        dest_path = _abs_event_path(event.dest_path)
         
         src_ignored = is_ignored_filename(os.path.basename(src_path))
         dest_ignored = is_ignored_filename(os.path.basename(dest_path))
@@ -1899,7 +2652,8 @@ class FileIntegrityMonitor:
         
         # Schedule the observer for EACH folder
         for folder in valid_folders:
-            self.observer.schedule(self.handler, folder, recursive=True)
+            # Absolute + normalised root -> event paths need no abspath later
+            self.observer.schedule(self.handler, os.path.abspath(folder), recursive=True)
             append_log_line(f"MONITOR_STARTED: {folder}")
 
         self.observer.start()
@@ -1915,7 +2669,7 @@ class FileIntegrityMonitor:
                         # CRITICAL: recursive=False for ALL system paths
                         # recursive=True on System32 = instant app freeze
                         self.observer.schedule(
-                            self.handler, sys_path, recursive=False)
+                            self.handler, os.path.abspath(sys_path), recursive=False)
                         append_log_line(
                             f"SYSTEM PATH PROTECTION: {sys_path}",
                             event_type="SYSTEM_MONITORING_ADDED",
@@ -2008,6 +2762,8 @@ class FileIntegrityMonitor:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+        if self.handler:
+            self.handler.flush_records(close=True)
         self.handler = None
         # Stop registry monitoring
         if REGISTRY_MONITOR_AVAILABLE:
@@ -2034,6 +2790,8 @@ class FileIntegrityMonitor:
         except Exception:
             pass
 
+        close_log_handles()
+
     def _start_folder_heartbeat(self, watch_folders: list, event_callback=None):
         """
         Active folder protection heartbeat — runs every 2 seconds.
@@ -2076,7 +2834,8 @@ class FileIntegrityMonitor:
             records_snapshot = dict(self.handler.records)
 
             for file_path in records_snapshot:
-                if not os.path.abspath(file_path).startswith(folder_abs):
+                # Record keys are already absolute (scan + event paths)
+                if not file_path.startswith(folder_abs):
                     continue   # not under this folder
 
                 # Skip files that already exist (partial deletion scenario)
@@ -2173,7 +2932,7 @@ class FileIntegrityMonitor:
                         if self.observer and self.handler:
                             try:
                                 self.observer.schedule(
-                                    self.handler, folder, recursive=True)
+                                    self.handler, os.path.abspath(folder), recursive=True)
                                 print(f"[HEARTBEAT] ✅ Observer re-scheduled "
                                     f"for: {folder}")
                             except Exception as oe:
@@ -2202,11 +2961,13 @@ class FileIntegrityMonitor:
                 append_log_line("PERIODIC_VERIFICATION_START")
                 
                 if self.handler:
-                    summary = verify_all_files_and_update(self.handler.records, self.current_watch_folders)
+                    summary = verify_all_files_and_update(self.handler.records, self.current_watch_folders,
+                                                          save_records=self.handler.flush_records)
                 else:
                     summary = verify_all_files_and_update(None, self.current_watch_folders)
                 
                 send_webhook_safe("PERIODIC_SUMMARY", "Periodic verification completed", None)
+                flush_logs()
                 
             except Exception as e:
                 append_log_line(f"ERROR in periodic verification: {e}")
@@ -2220,7 +2981,8 @@ class FileIntegrityMonitor:
         append_log_line("MANUAL_VERIFICATION_STARTED")
         
         if self.handler:
-            result = verify_all_files_and_update(self.handler.records, target_folders)
+            result = verify_all_files_and_update(self.handler.records, target_folders,
+                                                 save_records=self.handler.flush_records)
         else:
             result = verify_all_files_and_update(None, target_folders)
         
@@ -2229,12 +2991,23 @@ class FileIntegrityMonitor:
     def get_summary(self):
         try:
             if os.path.exists(REPORT_SUMMARY_FILE):
-                with open(REPORT_SUMMARY_FILE, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        return content
-                    else:
-                        return "Report summary file exists but is empty."
+                # Append-only history: read the recent end, not every past run
+                max_lines = 2000
+                with open(REPORT_SUMMARY_FILE, "rb") as f:
+                    size = f.seek(0, os.SEEK_END)
+                    start = tail_start_offset(f, size, max_lines)
+                    f.seek(start)
+                    data = f.read()
+                lines = data.decode("utf-8", errors="replace").splitlines()
+                content = "\n".join(lines).strip()
+                if content:
+                    if start > 0:
+                        # Say so instead of silently dropping older runs
+                        content = (f"… truncated: showing the last {max_lines} lines of "
+                                   f"{REPORT_SUMMARY_FILE}\n\n{content}")
+                    return content
+                else:
+                    return "Report summary file exists but is empty."
             else:
                 return "No report summary file found. Run a verification first."
         except Exception as e:
@@ -2284,12 +3057,9 @@ def archive_session():
     try:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         history_base = os.path.join(DATA_ROOT, "config", "history")
-        if not os.path.exists(history_base):
-            os.makedirs(history_base)
-            
         session_folder = os.path.join(history_base, f"Session_{timestamp}")
-        if not os.path.exists(session_folder):
-            os.makedirs(session_folder)
+        # One call creates history/ and the session folder; no exists() pre-checks
+        os.makedirs(session_folder, exist_ok=True)
 
         files_to_archive = [
             "integrity_log.dat",
@@ -2320,6 +3090,7 @@ def archive_session():
         
         # 2. Move files (with retry for WinError 32 file-lock race)
         import time as _time
+        close_log_handles()   # release our own append handles first
         for filename in files_to_archive:
             src = os.path.join(log_dir, filename)
             if not os.path.exists(src):
@@ -2385,6 +3156,15 @@ def archive_session():
         return False, str(e)
 
 
+def _plain_log_line(line):
+    """Decrypt one stripped log line (plain-text lines pass through)."""
+    # Fernet AES tokens ALWAYS start with 'gAAAA'. 
+    if line.startswith("gAAAA"):
+        # Decrypt the backend security logs
+        return crypto_manager.decrypt_string(line)
+    # Allow normal plain-text logs to pass through
+    return line
+
 def get_decrypted_logs(target_file=None):
     """Reads the encrypted log file and returns a list of readable plain-text strings."""
     # If no specific file is requested, default to the active log
@@ -2400,16 +3180,38 @@ def get_decrypted_logs(target_file=None):
                 line = line.strip()
                 if not line: 
                     continue
-                
-                # Fernet AES tokens ALWAYS start with 'gAAAA'. 
-                if line.startswith("gAAAA"):
-                    # Decrypt the backend security logs
-                    decrypted_text = crypto_manager.decrypt_string(line)
-                    plain_lines.append(decrypted_text)
-                else:
-                    # Allow normal plain-text logs to pass through
-                    plain_lines.append(line)
+                plain_lines.append(_plain_log_line(line))
                     
         return plain_lines
     except Exception as e:
-        return [f"Error reading logs: {e}"]
\ No newline at end of file
+        return [f"Error reading logs: {e}"]
+
+def read_decrypted_logs_from(cursor, max_lines=400, target_file=None):
+    """
+    Incremental reader for live log views.
+    Returns (next_cursor, plain_lines, restarted). `cursor` is the opaque
+    value returned by the previous call (None to start). Only complete lines
+    after it are decrypted; when the file was replaced (rotation / archive)
+    or truncated, the read restarts from the last `max_lines` lines and
+    `restarted` is True.
+    """
+    path = target_file if target_file else LOG_FILE
+    file_id, offset = cursor if isinstance(cursor, tuple) else (None, cursor or 0)
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            # st_ino is 0 where the platform can't report it – size check only
+            cur_id = (st.st_dev, st.st_ino) if st.st_ino else None
+            restarted = (offset <= 0 or offset > size
+                         or (file_id is not None and cur_id != file_id))
+            start = tail_start_offset(f, size, max_lines) if restarted else offset
+            f.seek(start)
+            data = f.read(size - start)
+    except OSError:
+        return None, [], True
+
+    end = data.rfind(b"\n") + 1   # leave a half-written last line for next time
+    lines = data[:end].decode("utf-8", errors="replace").splitlines()[-max_lines:]
+    plain = [_plain_log_line(l.strip()) for l in lines if l.strip()]
+    return (cur_id, start + end), plain, restarted
\ No newline at end of file
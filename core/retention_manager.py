@@ -23,6 +23,7 @@ import time
 import shutil
 import threading
 import glob
+import fnmatch
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -136,10 +137,14 @@ class RetentionManager:
 
         # 2. Trim active telemetry.jsonl to remove lines older than retention period
         telemetry_path = os.path.join(logs_dir, "telemetry.jsonl")
-        deleted["telemetry"] += self._trim_jsonl(
-            path=telemetry_path,
-            max_age_days=self._config["telemetry_days"]
-        )
+        # Hold telemetry appends while rewriting, so none are lost and the
+        # live append handle isn't left pointing at the replaced file
+        from core.event_schema import telemetry_detached
+        with telemetry_detached():
+            deleted["telemetry"] += self._trim_jsonl(
+                path=telemetry_path,
+                max_age_days=self._config["telemetry_days"]
+            )
 
         # 3. Forensic snapshots
         forensics_dir = os.path.join(app_data, "forensics")
@@ -176,33 +181,42 @@ class RetentionManager:
         from core.utils import get_app_data_dir
         app_data = get_app_data_dir()
 
-        def _dir_size_mb(path):
-            total = 0
-            if not os.path.isdir(path):
-                return 0.0
-            for f in os.listdir(path):
-                try:
-                    total += os.path.getsize(os.path.join(path, f))
-                except OSError:
-                    pass
-            return round(total / (1024 * 1024), 2)
-
-        def _file_count(path, pattern="*"):
-            if not os.path.isdir(path):
-                return 0
-            return len(glob.glob(os.path.join(path, pattern)))
+        def _dir_stats(path, pattern="*"):
+            """
+            (entries matching `pattern`, total size in MB) from ONE scandir
+            pass — the count no longer needs a second glob listing, and
+            DirEntry.stat() is served from the listing on Windows.
+            """
+            count, total = 0, 0
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        # glob("*") semantics: dotfiles don't count
+                        if not entry.name.startswith(".") and fnmatch.fnmatch(entry.name, pattern):
+                            count += 1
+                        try:
+                            total += entry.stat().st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass   # missing/unreadable dir -> 0, 0.0
+            return count, round(total / (1024 * 1024), 2)
 
         logs_dir      = os.path.join(app_data, "logs")
         forensics_dir = os.path.join(app_data, "forensics")
         history_dir   = os.path.join(app_data, "config", "history")
 
+        _, logs_mb                    = _dir_stats(logs_dir)
+        forensics_count, forensics_mb = _dir_stats(forensics_dir, "forensic_*.dat")
+        history_count, history_mb     = _dir_stats(history_dir)
+
         return {
             "settings": dict(self._config),
-            "telemetry_size_mb":   _dir_size_mb(logs_dir),
-            "forensics_count":     _file_count(forensics_dir, "forensic_*.dat"),
-            "forensics_size_mb":   _dir_size_mb(forensics_dir),
-            "history_sessions":    _file_count(history_dir),
-            "history_size_mb":     _dir_size_mb(history_dir),
+            "telemetry_size_mb":   logs_mb,
+            "forensics_count":     forensics_count,
+            "forensics_size_mb":   forensics_mb,
+            "history_sessions":    history_count,
+            "history_size_mb":     history_mb,
             "generated_at":        datetime.now().isoformat(),
         }
 
@@ -86,6 +86,7 @@ class SafeModeManager:
         self.active = False
         self.reason = ""
         self.start_time = None
+        self._start_time_cache = (None, None)   # (iso string, parsed datetime)
         self.previous_monitor_state = None
         self._load_state()
     
@@ -205,7 +206,11 @@ class SafeModeManager:
             return "Not active"
         
         try:
-            start = datetime.fromisoformat(self.start_time)
+            # start_time only changes on mode transitions -> parse once, not per poll
+            cached_src, start = self._start_time_cache
+            if cached_src != self.start_time:
+                start = datetime.fromisoformat(self.start_time)
+                self._start_time_cache = (self.start_time, start)
             now = datetime.now()
             diff = now - start
             
@@ -363,6 +368,8 @@ def check_and_enable_safe_mode_for_tamper(tamper_type, file_path):
 if __name__ == "__main__":
     # Test safe mode functionality
     print("Testing Safe Mode System...")
+    # enable/disable are synchronous; only pause when asked to
+    pace = float(os.environ.get("FMSECURE_TEST_PACE", "0"))
     
     manager = get_safe_mode_manager()
     
@@ -374,7 +381,8 @@ if __name__ == "__main__":
     print(f"Enable result: {result}")
     print(f"State after enable: {manager.get_status()}")
     
-    time.sleep(2)
+    if pace:
+        time.sleep(pace)
     
     # Test disabling safe mode
     print("\nDisabling safe mode...")
@@ -18,8 +18,7 @@ def init_severity_counters():
     }
     target_file = os.path.join("logs", "severity_counters.json")
     # Ensure logs dir exists (just in case)
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
+    os.makedirs("logs", exist_ok=True)
     
     with open(target_file, "w", encoding="utf-8") as f:
         json.dump(counters, f, indent=2)
@@ -181,10 +181,11 @@ LEVEL_PROFILES = {
 # Built at module load time for O(1) per-event lookups.
 
 _path_severity_map: dict = {}  # normalised_path → 'CRITICAL' | 'HIGH' | 'MEDIUM'
+_severity_prefixes: tuple = ()  # same keys, for a single str.startswith() reject
 
 
 def _build_severity_map():
-    global _path_severity_map
+    global _path_severity_map, _severity_prefixes
     m = {}
     for path in CRITICAL_PATHS.values():
         m[os.path.normcase(path)] = 'CRITICAL'
@@ -194,6 +195,7 @@ def _build_severity_map():
         if os.path.normcase(path) not in m:
             m[os.path.normcase(path)] = 'MEDIUM'
     _path_severity_map = m
+    _severity_prefixes = tuple(m)
 
 
 _build_severity_map()
@@ -248,6 +250,9 @@ def is_system_critical(filepath: str) -> str | None:
             severity = max(severity, sys_sev)
     """
     norm = os.path.normcase(os.path.abspath(filepath))
+    # Most event paths match no prefix at all — reject them in one C call
+    if not norm.startswith(_severity_prefixes):
+        return None
     # Check each known critical prefix
     for base_path, sev in _path_severity_map.items():
         try:
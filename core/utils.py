@@ -31,4 +31,31 @@ def get_app_data_dir():
         return app_data
         
     # Running as script: Keep using project root
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
\ No newline at end of file
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def tail_start_offset(f, size, n_lines, block=8192):
+    """Byte offset where the last `n_lines` lines of open binary file `f` begin."""
+    pos, buf = size, b""
+    while pos > 0 and buf.count(b"\n") <= n_lines:
+        step = min(block, pos)
+        pos -= step
+        f.seek(pos)
+        buf = f.read(step) + buf
+    lines = buf.splitlines(keepends=True)
+    return size - sum(len(l) for l in lines[-n_lines:]) if n_lines > 0 else size
+
+
+def tail_file(path, n_lines=200, block=8192):
+    """
+    Last `n_lines` lines of a text file, reading backwards in `block`-sized
+    chunks instead of the whole file. Returns [] if the file is missing.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(tail_start_offset(f, size, n_lines, block))
+            data = f.read()
+    except OSError:
+        return []
+    return data.decode("utf-8", errors="replace").splitlines(keepends=True)
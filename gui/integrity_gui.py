@@ -6,6 +6,8 @@ Redesigned GUI — Production-Grade UI
 """
 
 import random
+import functools
+import collections
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox, simpledialog
 import customtkinter as ctk
@@ -13,6 +15,7 @@ import threading
 import time
 import json
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import tempfile
 import sys
@@ -21,9 +24,9 @@ import os
 import pystray
 from PIL import Image as PILImage
 from pystray import MenuItem as item
-from core.utils import get_app_data_dir, get_base_path
+from core.utils import get_app_data_dir, get_base_path, tail_file
 from core.subscription_manager import subscription_manager  
-from core.integrity_core import get_decrypted_logs
+from core.integrity_core import get_decrypted_logs, read_decrypted_logs_from
 import socket
 import uuid
 import requests
@@ -67,7 +70,8 @@ try:
     print("✅ Backend imported successfully (Package Mode)")
 except ImportError:
     try:
-        sys.path.append('../core')
+        if '../core' not in sys.path:
+            sys.path.append('../core')
         import integrity_core as ic_module
         integrity_core = ic_module
         from integrity_core import (
@@ -98,9 +102,59 @@ except ImportError as e:
         print("❌ Auth Manager not found in any location")
         auth = None
 
+# Optional: event-driven live log feed (falls back to polling)
+try:
+    from watchdog.observers import Observer as LogObserver
+    from watchdog.events import FileSystemEventHandler as LogEventHandler
+    LOG_WATCH_AVAILABLE = True
+except ImportError:
+    LOG_WATCH_AVAILABLE = False
+
 from pathlib import Path
 import re
 
+# Report-summary parsing, compiled once at import
+SUMMARY_TOTAL_RE = re.compile(r'Total files monitored:\s*(\d+)')
+SUMMARY_LIST_RE = re.compile(r'^[ \t]*(Created|Modified|Deleted):(.*)$', re.M)
+LOG_BOX_MAX_LINES = 5000     # Live feed Text widget is trimmed back to this ...
+LOG_BOX_TRIM_SLACK = 500     # ... once it exceeds it by this much (amortised deletes)
+LIVE_FEED_LINES = 400        # decrypted log lines kept for the filterable feed
+
+
+def set_var_if_changed(var, value):
+    """StringVar.set only on a real change – every write fires traces and relayouts."""
+    value = str(value)
+    if var.get() != value:
+        var.set(value)
+
+
+def write_json_atomic(path, data):
+    """Write JSON via a temp file + os.replace so a crash never leaves it truncated."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def open_in_file_manager(path):
+    """Open a file/folder with the platform's default handler (non-blocking)."""
+    if sys.platform.startswith('win'):
+        os.startfile(path)
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', path])
+    else:
+        subprocess.Popen(['xdg-open', path])
+
+
+@functools.lru_cache(maxsize=16)
+def load_logo_image(path, size):
+    """Decode + resize an icon once; callers wrap it in their own PhotoImage."""
+    with PILImage.open(path) as img:
+        img = img.convert("RGBA")
+    return img if img.size == size else img.resize(size)
+
 # ─────────────────────────────────────────────
 #  DESIGN TOKENS — FMSecure v2.0
 #  Clean, professional, EDR-grade palette
@@ -468,7 +522,20 @@ class ProIntegrityGUI:
         self.status_var          = tk.StringVar(value='Stopped')
         self.status_var.trace_add('write', lambda *args: self._update_status_color())
         self._log_filter = 'ALL'
-        self._log_lines  = []
+        self._log_lines  = collections.deque(maxlen=LIVE_FEED_LINES)   # ring buffer
+        self._log_cursor = None  # read_decrypted_logs_from position in the live feed
+        self._pending_log = collections.deque()   # _append_log lines awaiting one batched insert
+        self._log_flush_scheduled = False
+        self._log_ts = (0, '')   # (epoch second, formatted '%H:%M:%S') for _append_log
+        # Paths polled by the periodic loops – resolved once, not per tick
+        self._lockdown_flag_path = os.path.join(get_app_data_dir(), "lockdown.flag")
+        self._severity_counter_path = getattr(integrity_core, 'SEVERITY_COUNTER_FILE', None) or SEVERITY_COUNTER_FILE
+        self._severity_counter_stamp = None
+        self._severity_counter_data = None
+        # One long-lived worker for every verification pass: runs queue instead
+        # of overlapping (run_verification rewrites the records + sig that
+        # verify_signatures is checking) and no thread is spawned per click.
+        self._verify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="verify")
         self.total_files_var     = tk.StringVar(value='0')
         self.created_var         = tk.StringVar(value='0')
         self.modified_var        = tk.StringVar(value='0')
@@ -593,6 +660,7 @@ class ProIntegrityGUI:
 
         self._update_dashboard()
         self._update_severity_counters()
+        self._start_log_watcher()
         self._tail_log_loop()
         self._clear_stale_lockdown_on_startup()   # ← ADD THIS LINE
         self._check_safe_mode_status()
@@ -618,11 +686,14 @@ class ProIntegrityGUI:
     # ─────────────────────────────────────────
 
     def _configure_styles(self):
-        try:
-            self.style = ttk.Style()
-            self.style.theme_use('clam')
-        except Exception:
-            self.style = ttk.Style()
+        # Select the base theme once: theme_use() makes every ttk widget
+        # re-theme itself, and a toggle only needs the colours below.
+        if getattr(self, 'style', None) is None:
+            try:
+                self.style = ttk.Style()
+                self.style.theme_use('clam')
+            except Exception:
+                self.style = ttk.Style()
 
         c = self.colors
         self.style.configure('Modern.TButton',
@@ -668,7 +739,7 @@ class ProIntegrityGUI:
         self.menu_btn.pack(side=tk.LEFT, padx=(4, 10), pady=14)
 
         # Shield icon (canvas-drawn, no image needed)
-        from PIL import Image, ImageTk
+        from PIL import ImageTk
 
         def resource_path(path):
             if getattr(sys, 'frozen', False):
@@ -678,8 +749,7 @@ class ProIntegrityGUI:
         try:
             logo_path = resource_path("assets/icons/app_icon.png")
 
-            img = Image.open(logo_path)
-            img = img.resize((32, 32))  # 👈 small header size
+            img = load_logo_image(logo_path, (32, 32))  # 👈 small header size
 
             self.header_logo = ImageTk.PhotoImage(img)
 
@@ -840,7 +910,7 @@ class ProIntegrityGUI:
                 if hasattr(self.monitor.handler, 'records'):
                     records = self.monitor.handler.records
                     if records is not None:
-                        self.total_files_var.set(str(len(records)))
+                        set_var_if_changed(self.total_files_var, len(records))
  
         except Exception as e:
             print(f'Dashboard update error: {e}')
@@ -852,24 +922,33 @@ class ProIntegrityGUI:
     def _update_severity_counters(self):
         """Update severity counters from disk"""
         try:
-            counter_path = SEVERITY_COUNTER_FILE
-            if integrity_core and hasattr(integrity_core, 'SEVERITY_COUNTER_FILE'):
-                counter_path = integrity_core.SEVERITY_COUNTER_FILE
+            counter_path = self._severity_counter_path
 
-            if os.path.exists(counter_path):
+            # Re-parse only when the counter file actually changed
+            try:
+                st = os.stat(counter_path)
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+            if stamp is not None and stamp != self._severity_counter_stamp:
+                self._severity_counter_stamp = stamp
+                self._severity_counter_data = None
                 try:
                     with open(counter_path, "r", encoding="utf-8") as f:
                         data = json.load(f)
                         if data and isinstance(data, dict):
-                            self.severity_counters = data
+                            self._severity_counter_data = data
                 except Exception:
                     pass
+            # The file stays authoritative, exactly as when it was re-read every tick
+            if stamp is not None and self._severity_counter_data:
+                self.severity_counters = dict(self._severity_counter_data)
 
             # Update UI Variables
-            self.critical_var.set(str(self.severity_counters.get('CRITICAL', 0)))
-            self.high_var.set(str(self.severity_counters.get('HIGH', 0)))
-            self.medium_var.set(str(self.severity_counters.get('MEDIUM', 0)))
-            self.info_var.set(str(self.severity_counters.get('INFO', 0)))
+            set_var_if_changed(self.critical_var, self.severity_counters.get('CRITICAL', 0))
+            set_var_if_changed(self.high_var, self.severity_counters.get('HIGH', 0))
+            set_var_if_changed(self.medium_var, self.severity_counters.get('MEDIUM', 0))
+            set_var_if_changed(self.info_var, self.severity_counters.get('INFO', 0))
             
         except Exception as e:
             pass
@@ -922,27 +1001,110 @@ class ProIntegrityGUI:
                 self._show_alert(f"{deleted_count} Deleted Files", 
                                f"{deleted_count} file(s) were deleted.", "high")
 
+    def _start_log_watcher(self):
+        """Wake the Live Security Feed on real writes to LOG_FILE instead of polling."""
+        self._log_changed = threading.Event()
+        self._log_observer = None
+        if not LOG_WATCH_AVAILABLE:
+            return
+
+        target = os.path.normcase(os.path.abspath(LOG_FILE))
+        changed = self._log_changed
+        root, on_change = self.root, self._on_log_changed
+
+        class _LogFileHandler(LogEventHandler):
+            def on_any_event(self, event):
+                # modified / created / moved (rotation) all mean "re-read"
+                for p in (event.src_path, getattr(event, 'dest_path', '')):
+                    if p and os.path.normcase(os.path.abspath(p)) == target:
+                        # One wake-up per burst: the flag stays set until the
+                        # Tk thread has actually read the new lines.
+                        if not changed.is_set():
+                            changed.set()
+                            try:
+                                root.after(0, on_change)
+                            except Exception:
+                                # Nothing will run on_change for this set():
+                                # clear it so later events aren't coalesced away
+                                changed.clear()
+                        return
+
+        try:
+            observer = LogObserver()
+            observer.daemon = True
+            observer.schedule(_LogFileHandler(), os.path.dirname(target), recursive=False)
+            observer.start()
+            self._log_observer = observer
+        except Exception as e:
+            print(f"⚠️ Log watcher unavailable, polling instead: {e}")
+
+    def _stop_log_watcher(self):
+        observer = getattr(self, '_log_observer', None)
+        self._log_observer = None
+        if observer:
+            try:
+                observer.stop()
+            except Exception:
+                pass
+
+    def _on_log_changed(self):
+        """Tk-thread side of the log watcher: read whatever was just appended."""
+        changed = getattr(self, '_log_changed', None)
+        if changed is not None:
+            changed.clear()
+        self._read_new_log_lines()
+
     def _tail_log_loop(self):
-        """Tail log file and populate Live Security Feed with filter support."""
+        """Safety poll for the Live Security Feed.
+
+        With the watcher running, new lines arrive via _on_log_changed and this
+        only catches missed events; without watchdog it is the 2 s poll.
+        """
+        # Also un-sticks the watcher flag if a wake-up was ever lost
+        changed = getattr(self, '_log_changed', None)
+        if changed is not None:
+            changed.clear()
+        self._read_new_log_lines()
+        watching = getattr(self, '_log_observer', None) is not None
+        self.root.after(15000 if watching else 2000, self._tail_log_loop)
+
+    def _read_new_log_lines(self):
+        """
+        Feed lines appended to LOG_FILE since the last read into the Live
+        Security Feed. Normally only the new lines are appended to log_box;
+        the box is fully re-rendered from _log_lines only on first load or
+        log rotation (and by the filter buttons).
+        """
         try:
             if os.path.exists(LOG_FILE):
+                # Only read (and decrypt) the bytes appended since the last tick
                 try:
-                    fresh_lines = get_decrypted_logs()[-400:]
+                    self._log_cursor, fresh_lines, restarted = read_decrypted_logs_from(
+                        getattr(self, '_log_cursor', None), max_lines=LIVE_FEED_LINES)
                 except Exception:
-                    fresh_lines = []
+                    fresh_lines, restarted = [], False
  
                 if not hasattr(self, '_log_lines'):
-                    self._log_lines = []
- 
-                # Only update if there are new lines
-                if len(fresh_lines) != len(self._log_lines):
-                    self._log_lines = [l for l in fresh_lines if l.strip()]
-                    self._render_filtered_logs()
+                    self._log_lines = collections.deque(maxlen=LIVE_FEED_LINES)
+ 
+                # Only update if there are new lines (or the log was rotated)
+                if restarted or fresh_lines:
+                    fresh_lines = [l for l in fresh_lines if l.strip()]
+                    if restarted:
+                        self._log_lines.clear()
+                    self._log_lines.extend(fresh_lines)
+                    if restarted:
+                        # Rotation/first load: rebuild the box from _log_lines
+                        self._render_filtered_logs()
+                    else:
+                        # _append_log already put its own "[GUI] msg" lines in
+                        # the box; don't show the file copy a second time
+                        self._render_filtered_logs(
+                            [l for l in fresh_lines if '[GUI] ' not in l])
  
         except Exception as e:
             print(f'Error in log tail: {e}')
- 
-        self.root.after(2000, self._tail_log_loop)
+
     # ─────────────────────────────────────────
     #  LEFT COLUMN
     # ─────────────────────────────────────────
@@ -1481,22 +1643,32 @@ class ProIntegrityGUI:
                 pill.configure(bg=C['tag_bg'], fg=clr, relief='flat')
  
  
-    def _render_filtered_logs(self):
-        """Re-render log_box with only lines matching the current filter."""
+    def _render_filtered_logs(self, new_lines=None):
+        """
+        Render log_box with only lines matching the current filter.
+        With `new_lines`, just append those; otherwise re-render everything.
+        Either way it is one state toggle and one insert, not one per line.
+        """
         level = getattr(self, '_log_filter', 'ALL')
-        lines = getattr(self, '_log_lines', [])
- 
+        lines = getattr(self, '_log_lines', []) if new_lines is None else new_lines
+
+        if level != 'ALL':
+            # Show line if it contains the filter keyword (case-insensitive)
+            key = level.upper()
+            lines = [line for line in lines if key in line.upper()]
+        if new_lines is not None and not lines:
+            return
+
         self.log_box.configure(state='normal')
-        self.log_box.delete('1.0', tk.END)
- 
-        for line in lines:
-            if level == 'ALL':
-                self.log_box.insert(tk.END, line + '\n')
-            else:
-                # Show line if it contains the filter keyword (case-insensitive)
-                if level.upper() in line.upper():
-                    self.log_box.insert(tk.END, line + '\n')
- 
+        if new_lines is None:
+            self.log_box.delete('1.0', tk.END)
+        if lines:
+            self.log_box.insert(tk.END, '\n'.join(lines) + '\n')
+        if new_lines is not None:
+            # Appending keeps history, so bound it the same way _flush_log does
+            last = int(self.log_box.index('end-1c').split('.')[0])
+            if last > LOG_BOX_MAX_LINES + LOG_BOX_TRIM_SLACK:
+                self.log_box.delete('1.0', f'{last - LOG_BOX_MAX_LINES}.0')
         self.log_box.configure(state='disabled')
         self.log_box.see(tk.END)
 
@@ -2044,18 +2216,24 @@ class ProIntegrityGUI:
     def _append_log(self, msg):
         """
         Write to the integrity log file AND show immediately in the UI.
-        Writing to file ensures _tail_log_loop never erases this line on re-render.
+        The live tail skips the "[GUI]" copy when appending, and a full
+        re-render (rotation/filter) shows it from the file instead.
         """
-        # 1. Immediate UI display (user sees it instantly)
-        try:
-            ts   = datetime.now().strftime('%H:%M:%S')
-            line = f'[{ts}]  {msg}\n'
-            self.log_box.configure(state='normal')
-            self.log_box.insert(tk.END, line)
-            self.log_box.see(tk.END)
-            self.log_box.configure(state='disabled')
-        except Exception:
-            pass
+        # 1. Queue for the UI (deque.append is thread-safe); bursts are
+        #    coalesced into a single insert by _flush_log ~50 ms later
+        # strftime only when the wall-clock second changes (one tuple = no torn reads)
+        now_s = int(time.time())
+        sec, ts = self._log_ts
+        if sec != now_s:
+            ts = time.strftime('%H:%M:%S', time.localtime(now_s))
+            self._log_ts = (now_s, ts)
+        self._pending_log.append(f'[{ts}]  {msg}\n')
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            try:
+                self.root.after(50, self._flush_log)
+            except Exception:
+                self._log_flush_scheduled = False
 
         # 2. Persist to file so re-renders never lose this line
         try:
@@ -2065,6 +2243,29 @@ class ProIntegrityGUI:
         except Exception:
             pass
 
+    def _flush_log(self):
+        """Runs on MAIN THREAD: move every queued _append_log line into log_box at once."""
+        self._log_flush_scheduled = False
+        pending = self._pending_log
+        chunk = []
+        while pending:
+            chunk.append(pending.popleft())
+        if not chunk:
+            return
+        try:
+            self.log_box.configure(state='normal')
+            self.log_box.insert(tk.END, ''.join(chunk))
+            # Bound Tk Text memory: once past the cap + slack, drop the oldest
+            # lines in one go (same state='normal' window as the insert)
+            last = int(self.log_box.index('end-1c').split('.')[0])
+            if last > LOG_BOX_MAX_LINES + LOG_BOX_TRIM_SLACK:
+                self.log_box.delete('1.0', f'{last - LOG_BOX_MAX_LINES}.0')
+            self.log_box.configure(state='disabled')
+            self.log_box.see(tk.END)
+            self.root.update_idletasks()
+        except Exception:
+            pass
+
     # Stub methods for vault/cloud tab buttons — bridge to existing core methods
     def _open_vault_viewer(self):
         self._append_log('Opening vault viewer…')
@@ -3201,8 +3402,7 @@ class ProIntegrityGUI:
                 file_cfg = dict(CONFIG)
                 
             file_cfg["active_defense"] = new_state
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(file_cfg, f, indent=4)
+            write_json_atomic(CONFIG_FILE, file_cfg)
                 
             load_config(CONFIG_FILE)
             self._sync_config_from_auth() 
@@ -3267,8 +3467,7 @@ class ProIntegrityGUI:
                 file_cfg = dict(CONFIG)
                 
             file_cfg["ransomware_killswitch"] = new_state
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(file_cfg, f, indent=4)
+            write_json_atomic(CONFIG_FILE, file_cfg)
                 
             load_config(CONFIG_FILE)
             self._append_log(f'Ransomware Killswitch {"ARMED" if new_state else "DISARMED"} by {self.username}')
@@ -3339,8 +3538,7 @@ class ProIntegrityGUI:
                 file_cfg = dict(CONFIG)
                 
             file_cfg["usb_readonly"] = new_state
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(file_cfg, f, indent=4)
+            write_json_atomic(CONFIG_FILE, file_cfg)
                 
             load_config(CONFIG_FILE)
             self._append_log(f'USB Control {"LOCKED (read-only)" if new_state else "UNLOCKED"} by {self.username}')
@@ -3533,8 +3731,9 @@ class ProIntegrityGUI:
         
         # Save to JSON cache for future chart generation
         try:
+            # Can hold every changed path of a scan: compact, single write
             with open(REPORT_DATA_JSON, 'w') as f:
-                json.dump(normalized, f, indent=4)
+                f.write(json.dumps(normalized, separators=(',', ':')))
         except Exception as e:
             print(f"Failed to save report cache: {e}")
 
@@ -3544,38 +3743,38 @@ class ProIntegrityGUI:
     
     def _parse_summary_from_file(self):
         """Fallback text parser if JSON is missing - IMPORTED FROM BACKUP"""
-        if not os.path.exists(REPORT_SUMMARY_FILE):
+        # The summary file is append-only: only the newest block matters, and
+        # only when the file actually changed since the last parse.
+        try:
+            st = os.stat(REPORT_SUMMARY_FILE)
+        except OSError:
             return {}
+        key = (st.st_mtime_ns, st.st_size)
+        cached = getattr(self, '_summary_cache', None)
+        if cached and cached[0] == key:
+            return dict(cached[1])
         
         try:
-            with open(REPORT_SUMMARY_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
+            lines = [l.rstrip('\r\n') for l in tail_file(REPORT_SUMMARY_FILE, 64)]
+            for i in range(len(lines) - 1, -1, -1):
+                if lines[i].startswith('=== Summary @'):
+                    lines = lines[i:]
+                    break
+            content = '\n'.join(lines)
             
-            summary = {}
-            lines = content.split('\n')
+            summary = {'created': [], 'modified': [], 'deleted': []}
             
-            # Helper to extract lists from text lines
-            def extract_files(prefix):
-                files = []
-                for line in lines:
-                    if line.strip().startswith(prefix):
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            raw_files = parts[1].split(',')
-                            files = [f.strip() for f in raw_files if f.strip()]
-                return files
-
-            summary['created'] = extract_files('Created:')
-            summary['modified'] = extract_files('Modified:')
-            summary['deleted'] = extract_files('Deleted:')
+            # One pass over the block for all three file lists (last line wins)
+            for m in SUMMARY_LIST_RE.finditer(content):
+                summary[m.group(1).lower()] = [f.strip() for f in m.group(2).split(',') if f.strip()]
             
             # Extract total count
-            import re
-            total_match = re.search(r'Total files monitored:\s*(\d+)', content)
+            total_match = SUMMARY_TOTAL_RE.search(content)
             if total_match:
                 summary['total_monitored'] = int(total_match.group(1))
             
-            return summary
+            self._summary_cache = (key, summary)
+            return dict(summary)
         except Exception as e:
             print(f"Error parsing summary file: {e}")
             return {}
@@ -4073,15 +4272,9 @@ class ProIntegrityGUI:
                                     "Would you like to open the containing folder?")
         if result:
             try:
-                folder_path = os.path.dirname(filepath)
-                os.startfile(folder_path)
-            except:
-                # Fallback for Linux/Mac
-                try:
-                    import subprocess
-                    subprocess.run(['xdg-open', folder_path])
-                except:
-                    pass
+                open_in_file_manager(os.path.dirname(filepath))
+            except Exception:
+                pass
 
     # ===== CORE ACTION METHODS FROM BACKUP =====
     
@@ -4141,12 +4334,10 @@ class ProIntegrityGUI:
         CONFIG["watch_folders"] = folders
         
         try:
-            import json
             # Import the exact config file path the backend is using!
             from core.integrity_core import CONFIG_FILE 
             
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(CONFIG, f, indent=4)
+            write_json_atomic(CONFIG_FILE, CONFIG)
                 
         except Exception as e:
             from tkinter import messagebox
@@ -4165,26 +4356,38 @@ class ProIntegrityGUI:
             return
 
         import requests
-        try:
-            # Connect to your new secure render endpoint
-            url = "https://fmsecure.onrender.com/api/license/recover_key"
-            
-            # We don't need to wait for a specific success boolean because 
-            # the server uses Blind Responses for security.
-            requests.post(url, json={"email": email.strip()}, timeout=10)
-
-            messagebox.showinfo(
-                "Recovery Requested",
-                "If that email is registered in our system, your license key has been sent to your inbox.\n\n"
-                "Please check your spam/junk folder as well.",
-                parent=parent_win
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Connection Error", 
-                f"Could not reach the license server.\n\n{e}",
-                parent=parent_win
-            )
+
+        def _on_done(error):
+            # MAIN THREAD: report the outcome
+            if error is None:
+                messagebox.showinfo(
+                    "Recovery Requested",
+                    "If that email is registered in our system, your license key has been sent to your inbox.\n\n"
+                    "Please check your spam/junk folder as well.",
+                    parent=parent_win
+                )
+            else:
+                messagebox.showerror(
+                    "Connection Error", 
+                    f"Could not reach the license server.\n\n{error}",
+                    parent=parent_win
+                )
+
+        def _send():
+            # Worker thread: the TLS round-trip must not freeze the Tk loop
+            try:
+                # Connect to your new secure render endpoint
+                url = "https://fmsecure.onrender.com/api/license/recover_key"
+                
+                # We don't need to wait for a specific success boolean because 
+                # the server uses Blind Responses for security.
+                requests.post(url, json={"email": email.strip()}, timeout=10)
+                error = None
+            except Exception as e:
+                error = e
+            self.root.after(0, _on_done, error)
+
+        threading.Thread(target=_send, daemon=True).start()
 
     # ══════════════════════════════════════════════════════════════════════════════
     #  PATCH 2 — Replace _show_activation_dialog with this version
@@ -4232,13 +4435,14 @@ class ProIntegrityGUI:
     
         # Try to load the app icon as a small logo
         try:
-            from PIL import Image, ImageTk
+            from PIL import ImageTk
             import sys
             base = sys._MEIPASS if getattr(sys, 'frozen', False) else \
                    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             logo_path = os.path.join(base, "assets", "icons", "app_icon.png")
-            img = Image.open(logo_path).resize((52, 52))
-            self._activation_logo = ImageTk.PhotoImage(img)
+            # Re-opening the dialog reuses the PhotoImage already bound to this root
+            if getattr(self, '_activation_logo', None) is None:
+                self._activation_logo = ImageTk.PhotoImage(load_logo_image(logo_path, (52, 52)))
             logo_lbl = tk.Label(title_row, image=self._activation_logo, bg=C['card_bg'])
             logo_lbl.pack(side=tk.LEFT, padx=(0, 14))
         except Exception:
@@ -5031,7 +5235,7 @@ class ProIntegrityGUI:
                     if self.monitor.handler and hasattr(self.monitor.handler, 'records'):
                         records = self.monitor.handler.records
                         if records is not None:
-                            self.total_files_var.set(str(len(records)))
+                            set_var_if_changed(self.total_files_var, len(records))
                 else:
                     self._append_log("Monitor failed to start")
                     messagebox.showerror("Error", "Monitor failed to start.")
@@ -5068,99 +5272,134 @@ class ProIntegrityGUI:
         if not folder or not os.path.exists(folder):
             messagebox.showerror("Error", "Choose valid folder first.")
             return
+        if getattr(self, '_manual_verify_inflight', False):
+            return  # a verification is already running – don't stack workers
+        self._manual_verify_inflight = True
+        self._append_log("Manual security verification started...")
 
         def _verify():
+            # Worker thread: hashing only – every widget update goes through after()
             try:
-                self._append_log("Manual security verification started...")
-                
                 # Run the backend verification
                 summary = self.monitor.run_verification(watch_folders=[folder])
                 
                 # Normalize AND SAVE to JSON cache automatically
                 normalized = self.normalize_report_data(summary)
-                
-                # Track file changes with severity
-                self._track_file_changes(normalized)
-                self.total_files_var.set(str(normalized.get('total', 0)))
-
-                # Update UI Status Indicators based on verification results
-                rec_status = "TAMPERED" if normalized['tampered_records'] else "OK"
-                log_status = "TAMPERED" if normalized['tampered_logs'] else "OK"
-                
-                # Update the text variables
-                self.tamper_records_var.set(rec_status)
-                self.tamper_logs_var.set(log_status)
-                
-                # Show tamper alerts with CRITICAL severity if detected
-                if normalized['tampered_records']:
-                    self._show_alert("CRITICAL: Hash Database Tampered!", 
-                                   "File hash records have been tampered with!", 
-                                   "critical")
-                if normalized['tampered_logs']:
-                    self._show_alert("CRITICAL: Log Files Tampered!", 
-                                   "Audit log files have been tampered with!", 
-                                   "critical")
-                
-                # Force the dashboard to refresh colors immediately
-                self.root.after(0, self._update_tamper_indicators)
-                
-                # Show results with severity summary
-                txt = (f"🔍 SECURITY VERIFICATION COMPLETE\n\n"
-                    f"📊 Total monitored: {normalized['total']}\n"
-                    f"🟢 New files: {len(normalized['created'])}\n"
-                    f"🟡 Modified files: {len(normalized['modified'])}\n"
-                    f"🔴 Deleted files: {len(normalized['deleted'])}\n\n"
-                    f"🚨 SECURITY STATUS:\n"
-                    f"🔥 CRITICAL - Hash DB: {'TAMPERED' if normalized['tampered_records'] else 'SECURE'}\n"
-                    f"🔥 CRITICAL - Logs: {'TAMPERED' if normalized['tampered_logs'] else 'SECURE'}\n")
-                
-                messagebox.showinfo("Security Verification Summary", txt)
-                self._append_log("Manual security verification finished.")
-                
+                self.root.after(0, self._apply_verification_result, normalized)
             except Exception as ex:
-                self._append_log(f"Verification error: {ex}")
                 traceback.print_exc()
-                messagebox.showerror("Error", f"Verification failed: {ex}")
+                self.root.after(0, self._apply_verification_error, ex)
 
-        threading.Thread(target=_verify, daemon=True).start()
+        self._verify_pool.submit(_verify)
 
-    def verify_signatures(self):
-        """Verify cryptographic signatures - IMPORTED FROM BACKUP"""
-        rec_ok = None
-        log_ok = None
-        rec_msg = ""
-        log_msg = ""
-        
+    def _apply_verification_result(self, normalized):
+        """Runs on MAIN THREAD with the result of run_verification's worker."""
+        self._manual_verify_inflight = False
         try:
-            if verify_records_signature_on_disk:
-                rec_ok = verify_records_signature_on_disk()
-                rec_msg = "records HMAC OK" if rec_ok else "records HMAC FAILED"
-            else:
-                rec_msg = "No verify_records available"
-        except Exception as ex:
-            rec_ok = False
-            rec_msg = f"Exception: {ex}"
+            # Track file changes with severity
+            self._track_file_changes(normalized)
+            set_var_if_changed(self.total_files_var, normalized.get('total', 0))
 
-        try:
-            if verify_log_signatures:
-                got = verify_log_signatures()
-                if isinstance(got, tuple):
-                    log_ok, detail = got
-                    log_msg = detail
-                elif isinstance(got, bool):
-                    log_ok = got
-                    log_msg = "log sig OK" if log_ok else "log sig FAILED"
-                else:
-                    log_msg = str(got)
-            else:
-                log_msg = "No verify_log available"
+            # Update UI Status Indicators based on verification results
+            rec_status = "TAMPERED" if normalized['tampered_records'] else "OK"
+            log_status = "TAMPERED" if normalized['tampered_logs'] else "OK"
+            
+            # Update the text variables
+            set_var_if_changed(self.tamper_records_var, rec_status)
+            set_var_if_changed(self.tamper_logs_var, log_status)
+            
+            # Show tamper alerts with CRITICAL severity if detected
+            if normalized['tampered_records']:
+                self._show_alert("CRITICAL: Hash Database Tampered!", 
+                               "File hash records have been tampered with!", 
+                               "critical")
+            if normalized['tampered_logs']:
+                self._show_alert("CRITICAL: Log Files Tampered!", 
+                               "Audit log files have been tampered with!", 
+                               "critical")
+            
+            # Force the dashboard to refresh colors immediately
+            self._update_tamper_indicators()
+            
+            # Show results with severity summary
+            txt = (f"🔍 SECURITY VERIFICATION COMPLETE\n\n"
+                f"📊 Total monitored: {normalized['total']}\n"
+                f"🟢 New files: {len(normalized['created'])}\n"
+                f"🟡 Modified files: {len(normalized['modified'])}\n"
+                f"🔴 Deleted files: {len(normalized['deleted'])}\n\n"
+                f"🚨 SECURITY STATUS:\n"
+                f"🔥 CRITICAL - Hash DB: {'TAMPERED' if normalized['tampered_records'] else 'SECURE'}\n"
+                f"🔥 CRITICAL - Logs: {'TAMPERED' if normalized['tampered_logs'] else 'SECURE'}\n")
+            
+            messagebox.showinfo("Security Verification Summary", txt)
+            self._append_log("Manual security verification finished.")
         except Exception as ex:
-            log_ok = False
-            log_msg = f"Exception: {ex}"
+            self._apply_verification_error(ex)
+
+    def _apply_verification_error(self, ex):
+        self._manual_verify_inflight = False
+        self._append_log(f"Verification error: {ex}")
+        messagebox.showerror("Error", f"Verification failed: {ex}")
+
+    def verify_signatures(self):
+        """Verify cryptographic signatures - IMPORTED FROM BACKUP"""
+        if getattr(self, '_verify_inflight', False):
+            return  # rapid clicks shouldn't stack HMAC passes
+        self._verify_inflight = True
+
+        def _run():
+            try:
+                result = self._verify_signatures_worker()
+            except Exception as ex:
+                result = {'rec_ok': False, 'log_ok': False,
+                          'rec_msg': f"Exception: {ex}", 'log_msg': f"Exception: {ex}"}
+            self.root.after(0, self._apply_verify_result, result)
+
+        self._verify_pool.submit(_run)
+
+    def _verify_signatures_worker(self):
+        """Pure compute (worker thread): check record + log HMACs, touch no widgets."""
+
+        def _check_records():
+            try:
+                if verify_records_signature_on_disk:
+                    rec_ok = verify_records_signature_on_disk()
+                    return rec_ok, "records HMAC OK" if rec_ok else "records HMAC FAILED"
+                return None, "No verify_records available"
+            except Exception as ex:
+                return False, f"Exception: {ex}"
+
+        def _check_logs():
+            try:
+                if verify_log_signatures:
+                    got = verify_log_signatures()
+                    if isinstance(got, tuple):
+                        return got[0], got[1]
+                    if isinstance(got, bool):
+                        return got, "log sig OK" if got else "log sig FAILED"
+                    return None, str(got)
+                return None, "No verify_log available"
+            except Exception as ex:
+                return False, f"Exception: {ex}"
+
+        # Independent files (records vs log/sig): hash both streams at once
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            f_rec = pool.submit(_check_records)
+            f_log = pool.submit(_check_logs)
+            rec_ok, rec_msg = f_rec.result()
+            log_ok, log_msg = f_log.result()
+
+        return {'rec_ok': rec_ok, 'log_ok': log_ok, 'rec_msg': rec_msg, 'log_msg': log_msg}
+
+    def _apply_verify_result(self, result):
+        """Runs on MAIN THREAD: reflect a signature check in the dashboard."""
+        self._verify_inflight = False
+        rec_ok, log_ok = result['rec_ok'], result['log_ok']
+        rec_msg, log_msg = result['rec_msg'], result['log_msg']
 
         # Update UI indicators
-        self.tamper_records_var.set("OK" if rec_ok else "TAMPERED" if rec_ok is False else "UNKNOWN")
-        self.tamper_logs_var.set("OK" if log_ok else "TAMPERED" if log_ok is False else "UNKNOWN")
+        set_var_if_changed(self.tamper_records_var, "OK" if rec_ok else "TAMPERED" if rec_ok is False else "UNKNOWN")
+        set_var_if_changed(self.tamper_logs_var, "OK" if log_ok else "TAMPERED" if log_ok is False else "UNKNOWN")
         
         # Show alert for tamper detection
         if rec_ok is False or log_ok is False:
@@ -5228,20 +5467,12 @@ class ProIntegrityGUI:
             new_cfg["admin_email"] = email_var.get() or None # Save the email
             
             try:
-                from core.utils import get_app_data_dir
-                app_data = get_app_data_dir()
-                config_dir = os.path.join(app_data, "config")
-                if not os.path.exists(config_dir):
-                    os.makedirs(config_dir)
-                    
-                target_file = os.path.join(config_dir, "config.json")
+                # Same file load_config() reads – the backend's universal config
+                from core.integrity_core import CONFIG_FILE as target_file
+                write_json_atomic(target_file, new_cfg)
                 
-                with open(target_file, "w", encoding="utf-8") as f:
-                    json.dump(new_cfg, f, indent=4)
-                
-                # Reload config
-                if load_config:
-                    load_config(target_file)
+                # new_cfg is CONFIG plus these edits: apply in place, no re-read
+                CONFIG.update(new_cfg)
                     
                 messagebox.showinfo("Settings", f"Configuration saved to:\n{target_file}")
                 self._show_alert("Settings Updated", "Security configuration has been updated.", "info")
@@ -5290,16 +5521,18 @@ class ProIntegrityGUI:
         combined_content += f"{'='*60}\n\n"
         
         for report_file in report_files:
-            if os.path.exists(report_file):
-                try:
-                    with open(report_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        combined_content += f"\n{'='*60}\n"
-                        combined_content += f"CONTENT FROM: {report_file}\n"
-                        combined_content += f"{'='*60}\n\n"
-                        combined_content += content + "\n"
-                except Exception as ex:
-                    combined_content += f"Error reading {report_file}: {ex}\n"
+            try:
+                # Reports only ever grow – show the most recent part.
+                # A missing file simply yields no lines (no exists() pre-check).
+                lines = tail_file(report_file, 2000)
+                if not lines:
+                    continue
+                combined_content += f"\n{'='*60}\n"
+                combined_content += f"CONTENT FROM: {report_file}\n"
+                combined_content += f"{'='*60}\n\n"
+                combined_content += "".join(lines) + "\n"
+            except Exception as ex:
+                combined_content += f"Error reading {report_file}: {ex}\n"
         
         if combined_content:
             self._show_text("Combined Security Reports", combined_content)
@@ -5330,7 +5563,7 @@ class ProIntegrityGUI:
         """Open reports folder - IMPORTED FROM BACKUP"""
         folder = os.path.abspath(".")
         try:
-            os.startfile(folder)
+            open_in_file_manager(folder)
         except Exception:
             messagebox.showinfo("Info", f"Open folder: {folder}")
 
@@ -5391,7 +5624,7 @@ class ProIntegrityGUI:
     
     def _clear_logs(self):
         """Clear the log display and in-memory cache."""
-        self._log_lines = []
+        self._log_lines.clear()
         self.log_box.configure(state='normal')
         self.log_box.delete('1.0', tk.END)
         self.log_box.configure(state='disabled')
@@ -5626,65 +5859,57 @@ class ProIntegrityGUI:
         self.status_label.configure(bg=pill_bg, fg='#ffffff')
 
     def _update_widget_colors(self, widget):
-        """Recursively update widget colors, skipping the side menu"""
-        # SKIP if this widget belongs to the side menu
-        if self._is_side_menu_widget(widget):
-            return
-
-        try:
-            if isinstance(widget, tk.Frame):
-                if 'card' in str(widget).lower():
-                    widget.configure(bg=self.colors['card_bg'],
-                                highlightbackground=self.colors['card_border'])
-                elif 'header' in str(widget).lower():
-                    widget.configure(bg=self.colors['header_bg'])
-                else:
-                    widget.configure(bg=self.colors['bg'])
-            
-            elif isinstance(widget, tk.Label):
-                # Skip counter labels - they're handled separately
-                if hasattr(self, 'file_counter_labels') and widget in [label for label, _, _ in self.file_counter_labels]:
-                    pass
-                elif hasattr(self, 'severity_counter_labels') and widget in [label for label, _, _ in self.severity_counter_labels]:
-                    pass
-                elif 'footer' in str(widget).lower():
-                    widget.configure(bg=self.colors['bg'], fg=self.colors['text_muted'])
-                elif 'card' in str(widget).lower() or (isinstance(widget.master, tk.Frame) and 'card' in str(widget.master).lower()):
-                    widget.configure(bg=self.colors['card_bg'], fg=self.colors['text_primary'])
-                else:
-                    widget.configure(bg=self.colors['bg'], fg=self.colors['text_primary'])
-            
-            elif isinstance(widget, tk.Button):
-                # Update standard buttons, but skip special toggle buttons
-                if widget not in [self.theme_btn, getattr(self, 'menu_btn', None), getattr(self, 'pass_btn', None), 
-                                getattr(self, 'unlock_btn', None), getattr(self, 'logout_btn', None)]:
-                    widget.configure(bg=self.colors['button_bg'], fg=self.colors['text_primary'])
-            
-            elif isinstance(widget, scrolledtext.ScrolledText):
-                widget.configure(bg=self.colors['card_bg'], fg=self.colors['text_primary'],
-                            insertbackground=self.colors['text_primary'])
-        except Exception as e:
-            pass # Ignore configuration errors for widgets that might not support options
-        
-        # Update children
-        for child in widget.winfo_children():
-            self._update_widget_colors(child)
+        """Update widget colors for the whole tree under `widget`, skipping the side menu"""
+        C = self.colors
+        # Resolve the skip-lists once per walk instead of once per widget
+        side_menu = getattr(self, 'side_menu', None) or None
+        counter_labels = {label for label, _, _ in getattr(self, 'file_counter_labels', ())}
+        counter_labels.update(label for label, _, _ in getattr(self, 'severity_counter_labels', ()))
+        special_buttons = {b for b in (self.theme_btn, getattr(self, 'menu_btn', None),
+                                       getattr(self, 'pass_btn', None), getattr(self, 'unlock_btn', None),
+                                       getattr(self, 'logout_btn', None)) if b is not None}
+
+        stack = [widget]
+        while stack:
+            widget = stack.pop()
+            # SKIP the side menu and (by not descending) all of its children
+            if side_menu is not None and widget is side_menu:
+                continue
 
-    def _is_side_menu_widget(self, widget):
-        """Check if a widget is part of the side menu"""
-        if not hasattr(self, 'side_menu') or not self.side_menu:
-            return False
+            try:
+                if isinstance(widget, tk.Frame):
+                    name = str(widget).lower()
+                    if 'card' in name:
+                        widget.configure(bg=C['card_bg'], highlightbackground=C['card_border'])
+                    elif 'header' in name:
+                        widget.configure(bg=C['header_bg'])
+                    else:
+                        widget.configure(bg=C['bg'])
+                
+                elif isinstance(widget, tk.Label):
+                    # Skip counter labels - they're handled separately
+                    if widget not in counter_labels:
+                        name = str(widget).lower()
+                        if 'footer' in name:
+                            widget.configure(bg=C['bg'], fg=C['text_muted'])
+                        elif 'card' in name or (isinstance(widget.master, tk.Frame) and 'card' in str(widget.master).lower()):
+                            widget.configure(bg=C['card_bg'], fg=C['text_primary'])
+                        else:
+                            widget.configure(bg=C['bg'], fg=C['text_primary'])
+                
+                elif isinstance(widget, tk.Button):
+                    # Update standard buttons, but skip special toggle buttons
+                    if widget not in special_buttons:
+                        widget.configure(bg=C['button_bg'], fg=C['text_primary'])
+                
+                elif isinstance(widget, scrolledtext.ScrolledText):
+                    widget.configure(bg=C['card_bg'], fg=C['text_primary'],
+                                insertbackground=C['text_primary'])
+            except Exception as e:
+                pass # Ignore configuration errors for widgets that might not support options
             
-        # Traverse up the widget hierarchy to see if the side_menu is a parent
-        current = widget
-        while current:
-            if current == self.side_menu:
-                return True
-            # Stop if we hit root to prevent infinite loops (though unlikely in Tk)
-            if current == self.root:
-                break
-            current = current.master
-        return False
+            # Update children
+            stack.extend(widget.winfo_children())
 
     def _apply_permissions(self):
         """Disable controls based on user role"""
@@ -6453,7 +6678,9 @@ class ProIntegrityGUI:
                 from core.demo_simulator import DemoSimulator
             except ImportError:
                 try:
-                    sys.path.append('../core')
+                    # Runs on every demo click: don't grow sys.path each time
+                    if '../core' not in sys.path:
+                        sys.path.append('../core')
                     from core.demo_simulator import DemoSimulator
                 except ImportError:
                     messagebox.showerror("Error", "Demo simulator not available")
@@ -6861,6 +7088,8 @@ class ProIntegrityGUI:
                 return  # Cancel quit if auth fails or is closed
 
         # 2. Stop everything safely
+        self._stop_log_watcher()
+        self._verify_pool.shutdown(wait=False, cancel_futures=True)
         if hasattr(self, 'tray_icon'):
             self.tray_icon.stop()
         self.root.quit()
@@ -6933,16 +7162,13 @@ class ProIntegrityGUI:
     def _check_safe_mode_status(self):
         """Check if backend triggered Safe Mode"""
         try:
-            from core.utils import get_app_data_dir
-            app_data = get_app_data_dir()
-            lockdown_path = os.path.join(app_data, "lockdown.flag")
-            is_safe = os.path.exists(lockdown_path)
+            is_safe = os.path.exists(self._lockdown_flag_path)
             
             if not is_safe and safe_mode:
                 is_safe = safe_mode.is_safe_mode_enabled()
 
             if is_safe:
-                self.status_var.set("⛔ SAFE MODE ACTIVE")
+                set_var_if_changed(self.status_var, "⛔ SAFE MODE ACTIVE")
                 self.status_label.configure(foreground=self.colors['accent_danger'])
                 
                 # Disable buttons
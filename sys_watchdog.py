@@ -1,19 +1,48 @@
 import time
+import random
 import subprocess
 import sys
 import os
-from datetime import datetime
+import atexit
+
+WATCHDOG_LOG = "watchdog_log.txt"
+RESPAWN_DELAY_MIN = 2     # seconds before the first resurrection
+RESPAWN_DELAY_MAX = 60    # cap while FMSecure keeps crashing
+HEALTHY_RUN_SECS  = 60    # a run this long resets the backoff
+_LOG_FH = None   # opened once, reused for every event
+
+def _close_log():
+    global _LOG_FH
+    if _LOG_FH is not None:
+        try:
+            _LOG_FH.close()
+        except OSError:
+            pass
+        _LOG_FH = None
+
+atexit.register(_close_log)
+
+_LAST_TS = (None, "")   # (epoch second, formatted) — one strftime per second
+
+def _timestamp():
+    global _LAST_TS
+    t = int(time.time())
+    if _LAST_TS[0] != t:
+        _LAST_TS = (t, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t)))
+    return _LAST_TS[1]
 
 def log_event(message):
     """Log watchdog events to a simple text file"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_msg = f"[{timestamp}] {message}\n"
+    global _LOG_FH
+    log_msg = f"[{_timestamp()}] {message}\n"
     print(log_msg.strip())
     try:
-        with open("watchdog_log.txt", "a") as f:
-            f.write(log_msg)
-    except:
-        pass
+        if _LOG_FH is None:
+            # Line-buffered: each event hits the file before we block in wait()
+            _LOG_FH = open(WATCHDOG_LOG, "a", encoding="utf-8", buffering=1)
+        _LOG_FH.write(log_msg)
+    except OSError:
+        _close_log()   # retry the open on the next event
 
 def start_watchdog():
     log_event("🐕 Watchdog Service Initialized. Protecting FMSecure...")
@@ -36,30 +65,37 @@ def start_watchdog():
         return
 
     is_recovery = False
+    # creationflags is Windows-only (any non-zero value raises on POSIX)
+    DETACHED_PROCESS = 0x00000008
+    launch_kwargs = {"creationflags": DETACHED_PROCESS} if os.name == "nt" else {}
+
+    delay = RESPAWN_DELAY_MIN
 
     while True:
         log_event(f"🚀 Launching {app_target}...")
+        started = time.monotonic()
         try:
             # Add the recovery flag if we are resurrecting it
             cmd = base_cmd + ["--recovery"] if is_recovery else base_cmd
-            DETACHED_PROCESS = 0x00000008
-            process = subprocess.Popen(cmd, creationflags=DETACHED_PROCESS)
-            
-            process.wait()
-            exit_code = process.returncode
+            # Blocks until the app exits and always reaps the child
+            exit_code = subprocess.run(cmd, check=False, **launch_kwargs).returncode
             
             if exit_code == 0:
                 log_event("🛑 FMSecure closed normally. Watchdog sleeping.")
                 break 
-            else:
-                log_event(f"⚠️ ALERT: FMSecure killed unexpectedly (Exit Code: {exit_code})!")
-                log_event("🔄 Resurrecting in 2 seconds...")
-                is_recovery = True
-                time.sleep(2)
-                
+            log_event(f"⚠️ ALERT: FMSecure killed unexpectedly (Exit Code: {exit_code})!")
+            is_recovery = True
         except Exception as e:
             log_event(f"❌ Watchdog error: {e}")
-            time.sleep(5)
+
+        # Exponential backoff: a one-off kill is resurrected in ~2 s, a crash
+        # loop settles at one respawn a minute instead of one every 2 s.
+        if time.monotonic() - started > HEALTHY_RUN_SECS:
+            delay = RESPAWN_DELAY_MIN
+        wait = delay + random.uniform(0, 0.5)
+        log_event(f"🔄 Resurrecting in {wait:.1f} seconds...")
+        time.sleep(wait)
+        delay = min(delay * 2, RESPAWN_DELAY_MAX)
 
 if __name__ == "__main__":
     start_watchdog()
\ No newline at end of file
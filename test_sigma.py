@@ -4,34 +4,55 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.sigma_engine import SimpleSigmaEngine, get_loaded_rules
 
-rules_dir = os.path.join("core", "sigma_rules")
-engine = SimpleSigmaEngine(rules_dir)
-
-print(f"\n{'─'*60}")
-print(f"  Loaded {len(engine.rules)} rules")
-print(f"{'─'*60}")
-for r in engine.rules:
-    print(f"  [{r['level'].upper():8}] {r['title']}")
-    print(f"           Tags: {', '.join(r.get('tags', []))}")
-print(f"{'─'*60}\n")
-
-# Test each rule
-tests = [
-    ("Ransomware", {"fmsecure": {"event_type": "RANSOMWARE_BURST"}, "message": "test"}),
-    ("LOLBin",     {"fmsecure": {"event_type": "PROCESS_ATTRIBUTION"},
-                    "message": "powershell.exe modified a file"}),
-    ("Startup",    {"fmsecure": {"event_type": "CREATED"},
-                    "file": {"path": r"C:\Users\test\AppData\Roaming\Microsoft\Windows\Start Menu\Programs\Startup\evil.exe"},
-                    "message": "CREATED: evil.exe"}),
-    ("NoMatch",    {"fmsecure": {"event_type": "CREATED"},
-                    "file": {"path": "D:/TEST/notes.txt"},
-                    "message": "CREATED: notes.txt"}),
-]
-
-for name, event in tests:
-    match = engine.evaluate(event)
-    if match:
-        print(f"  ✅ {name:12} → MATCHED: {match['title']} [{match['level']}]")
-    else:
-        print(f"  ✅ {name:12} → No match (expected)" if name == "NoMatch"
-              else f"  ❌ {name:12} → No match (unexpected!)")
\ No newline at end of file
+_BAR = '─' * 60
+
+
+def main(argv=None):
+    rules_dir = os.path.join("core", "sigma_rules")
+    engine = SimpleSigmaEngine(rules_dir)
+
+    # Build the whole rules banner, then write it once
+    banner = [f"\n{_BAR}", f"  Loaded {len(engine.rules)} rules", _BAR]
+    for r in engine.rules:
+        banner.append(f"  [{r['level'].upper():8}] {r['title']}")
+        banner.append(f"           Tags: {', '.join(r.get('tags', []))}")
+    banner.append(f"{_BAR}\n")
+    print("\n".join(banner))
+
+    # Test each rule
+    tests = [
+        ("Ransomware", {"fmsecure": {"event_type": "RANSOMWARE_BURST"}, "message": "test"}),
+        ("LOLBin",     {"fmsecure": {"event_type": "PROCESS_ATTRIBUTION"},
+                        "message": "powershell.exe modified a file"}),
+        ("Startup",    {"fmsecure": {"event_type": "CREATED"},
+                        "file": {"path": r"C:\Users\test\AppData\Roaming\Microsoft\Windows\Start Menu\Programs\Startup\evil.exe"},
+                        "message": "CREATED: evil.exe"}),
+        ("NoMatch",    {"fmsecure": {"event_type": "CREATED"},
+                        "file": {"path": "D:/TEST/notes.txt"},
+                        "message": "CREATED: notes.txt"}),
+    ]
+
+    # CI: stop at the first wrong result (--fail-fast or FMSECURE_TEST_FAIL_FAST=1)
+    argv = sys.argv[1:] if argv is None else argv
+    fail_fast = "--fail-fast" in argv or os.environ.get("FMSECURE_TEST_FAIL_FAST") == "1"
+    failures = 0
+
+    for name, event in tests:
+        match = engine.evaluate(event)
+        expect_match = name != "NoMatch"
+        if match:
+            mark = "✅" if expect_match else "❌"
+            print(f"  {mark} {name:12} → MATCHED: {match['title']} [{match['level']}]")
+        else:
+            print(f"  ✅ {name:12} → No match (expected)" if not expect_match
+                  else f"  ❌ {name:12} → No match (unexpected!)")
+        if bool(match) != expect_match:
+            failures += 1
+            if fail_fast:
+                break
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())